@@ -3,7 +3,6 @@ import logging
 import logging.handlers
 import hashlib
 import threading
-import time
 from pathlib import Path
 from flask import Flask
 from .views.info_bp import InfoBlueprintManager
@@ -38,7 +37,8 @@ class ReserviaApp(Flask):
 
         self._configure_logging()
 
-        self.database = Database.get_instance(self.config_dict)
+        # Every app owns its Database, the views reach it through current_app.database
+        self.database = Database(self.config_dict)
 
         # Store application config in Flask's config for global access
         # This allows accessing config_dict from anywhere in the app via current_app.config['APP_CONFIG']
@@ -65,6 +65,12 @@ class ReserviaApp(Flask):
         log_level = getattr(logging, self.config_dict['log']['level'])
         backup_count = self.config_dict['log']['backupCount']
 
+        if log_level >= logging.CRITICAL:
+            # Nothing is logged at this level (e.g. test runs), so neither the log file
+            # nor the console handler is opened and every log call ends at the level check
+            logging.basicConfig(level=log_level, handlers=[logging.NullHandler()])
+            return
+
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -102,26 +108,54 @@ class ReserviaApp(Flask):
 
     def _stop_expiration_thread(self):
         """Stop the background expiration thread."""
-        self.stop_expiration_thread = True
+        with self.database.expiration_condition:
+            self.stop_expiration_thread = True
+            self.database.expiration_condition.notify_all()
         if self.expiration_thread and self.expiration_thread.is_alive():
             self.expiration_thread.join(timeout=2)
             logging.info("ReserviaApp: Expiration thread stopped")
 
     def _expiration_worker(self):
-        """Background worker that checks for expired approved reservations."""
+        """
+        Background worker that checks for expired approved reservations.
+
+        Instead of polling, it sleeps until the earliest reservation deadline, at most
+        expiration_check_interval_sec, and is woken up early when a new deadline is set.
+        """
         interval = CONFIG['expiration_check_interval_sec']
-        logging.info(f"ReserviaApp: Expiration worker started with {interval}s interval")
+        # A deadline left overdue (e.g. by a failing sweep) must not make the worker spin
+        min_wait = 1
+        logging.info(f"ReserviaApp: Expiration worker started with {interval}s maximum wait")
+        condition = self.database.expiration_condition
         
         while not self.stop_expiration_thread:
+            # One clock reading per round, for the sweep and for the next deadline alike
+            current_epoch = self.database._now()
+            self.sweep_expired_once(current_epoch)
+
             try:
-                self.database.check_expired_reservations()
+                wait_seconds = self.database.seconds_until_next_expiration(current_epoch)
             except Exception as e:
                 logging.error(f"ReserviaApp: Error in expiration worker: {str(e)}")
-            
-            time.sleep(interval)
+                wait_seconds = None
+            if wait_seconds is None or wait_seconds > interval:
+                wait_seconds = interval
+            wait_seconds = max(min_wait, wait_seconds)
+
+            # A deadline set after the sweep leaves expiration_pending behind, so it is not missed
+            with condition:
+                condition.wait_for(lambda: self.database.expiration_pending or self.stop_expiration_thread, wait_seconds)
+                self.database.expiration_pending = False
         
         logging.info("ReserviaApp: Expiration worker stopped")
 
+    def sweep_expired_once(self, current_epoch=None):
+        """Check for expired reservations a single time, without waiting for the interval."""
+        try:
+            self.database.check_expired_reservations(current_epoch)
+        except Exception as e:
+            logging.error(f"ReserviaApp: Error in expiration worker: {str(e)}")
+
     def shutdown(self):
         """Shutdown the application and clean up resources."""
         self._stop_expiration_thread()
\ No newline at end of file
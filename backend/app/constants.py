@@ -1,4 +1,7 @@
 # Global logging prefix constants
 LOG_PREFIX_DATABASE = "DATABASE - "
 LOG_PREFIX_ENDPOINT = "ENDPOINT - "
-LOG_PREFIX_APPLICATION = "APPLICATION - "
\ No newline at end of file
+LOG_PREFIX_APPLICATION = "APPLICATION - "
+
+# Database name that selects a private in-memory SQLite database instead of a file
+IN_MEMORY_DATABASE = ":memory:"
@@ -3,16 +3,32 @@ import logging
 import hashlib
 import threading
 from pathlib import Path
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Boolean, text
+from sqlalchemy import create_engine, event, func, Column, Index, Integer, String, ForeignKey, Boolean, text, select, insert, update, lambda_stmt
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from .constants import LOG_PREFIX_DATABASE
+from sqlalchemy.orm import sessionmaker, relationship, contains_eager
+from sqlalchemy.pool import StaticPool, NullPool, QueuePool
+from .constants import LOG_PREFIX_DATABASE, IN_MEMORY_DATABASE
 from .utils import get_current_epoch, epoch_to_iso8601
-from flask import session
+from flask import session, current_app, has_app_context
 from backend.config.config import CONFIG
 
 Base = declarative_base()
 
+# Applied in test_mode unless config_dict['database']['pragmas'] is given, test data
+# does not have to survive a crash, so commits skip the fsync of the default settings
+TEST_MODE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+}
+
+# Values of config_dict['database']['pool'] for file databases, ':memory:' always uses a StaticPool
+POOL_CLASSES = {
+    'null': NullPool,
+    'queue': QueuePool,
+    'static': StaticPool,
+}
+
 class User(Base):
     __tablename__ = 'users'
 
@@ -43,7 +59,7 @@ class ReservationLifecycle(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     resource_id = Column(Integer, ForeignKey('resources.id'), nullable=False)
-    request_date = Column(Integer, nullable=False)
+    request_date = Column(Integer, nullable=False, index=True)
     approved_date = Column(Integer, nullable=True)
     cancelled_date = Column(Integer, nullable=True)
     released_date = Column(Integer, nullable=True)
@@ -52,32 +68,97 @@ class ReservationLifecycle(Base):
     user = relationship("User")
     resource = relationship("Resource")
 
+    __table_args__ = (
+        # Active reservations of one resource, see get_active_reservations()
+        Index('ix_reservation_lifecycle_active', 'resource_id', 'released_date', 'approved_date'),
+        # Only the not yet finished reservations can expire, the index stays small
+        # however long the history grows, see check_expired_reservations()
+        Index('ix_reservation_lifecycle_expiring', 'valid_until_date',
+              sqlite_where=text('released_date IS NULL AND cancelled_date IS NULL')),
+    )
+
 class Database:
     _instance = None
 
-    def __init__(self, config_dict=None):
+    def __init__(self, config_dict=None, engine=None):
         if hasattr(self, '_initialized'):
             return
 
         self.config_dict = config_dict
         self.lock = threading.Lock()
-        self._setup_database()
+
+        # The expiration worker waits on this condition until the next deadline,
+        # it is woken up early whenever a new deadline is set
+        self.expiration_condition = threading.Condition()
+        self.expiration_pending = False
+
+        # Set by every sweep that expired at least one reservation, see wait_for_next_expiration()
+        self.expired_event = threading.Event()
+
+        self._setup_database(engine)
         self._initialized = True
 
     @staticmethod
     def get_instance(config_dict=None):
+        """
+        Database of the running ReserviaApp, or a process wide one for code outside of it.
+
+        Inside an application context the database owned by current_app is returned,
+        so every ReserviaApp works with its own Database. Scripts without an app
+        (e.g. admin_tools) get a singleton built from config_dict on first use.
+        """
+        if has_app_context() and getattr(current_app, 'database', None) is not None:
+            return current_app.database
+
         if Database._instance is None:
             Database._instance = Database(config_dict)
         return Database._instance
 
-    def _setup_database(self):
+    def _setup_database(self, engine=None):
         db_dir = self.config_dict['data_dir']
         os.makedirs(db_dir, exist_ok=True)
 
-        db_path = os.path.join(db_dir, self.config_dict['database']['name'])
-        self.engine = create_engine(f'sqlite:///{db_path}')
+        db_name = self.config_dict['database']['name']
+        if engine is not None:
+            # Engine injected by the caller, e.g. one engine per test worker
+            db_path = engine.url
+            self.engine = engine
+        elif db_name == IN_MEMORY_DATABASE:
+            # Every SQLite connection to :memory: opens its own empty database,
+            # so all threads have to share the single connection of a StaticPool
+            db_path = db_name
+            self.engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+        else:
+            db_path = os.path.join(db_dir, db_name)
+            # Opening a SQLite file is cheap, so by default connections are not pooled
+            # and none stays open once the session has released it
+            pool_name = self.config_dict['database'].get('pool', 'null')
+            if pool_name not in POOL_CLASSES:
+                raise ValueError(f"Unknown database pool '{pool_name}', expected one of {sorted(POOL_CLASSES)}")
+            # A pooled connection may be handed to another thread, self.lock serializes its use
+            self.engine = create_engine(f'sqlite:///{db_path}', connect_args={'check_same_thread': False},
+                                        poolclass=POOL_CLASSES[pool_name])
+
+        # Optional PRAGMAs applied to every new connection, e.g. {'journal_mode': 'WAL', 'synchronous': 'NORMAL'}
+        pragmas = self.config_dict['database'].get('pragmas')
+        if pragmas is None and self.config_dict.get('test_mode'):
+            pragmas = TEST_MODE_PRAGMAS
+        if pragmas:
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                for pragma_name, pragma_value in pragmas.items():
+                    cursor.execute(f"PRAGMA {pragma_name}={pragma_value}")
+                cursor.close()
+
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
+
         Base.metadata.create_all(self.engine)
 
+        # create_all() skips tables that already exist, add indexes introduced later to older databases
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
 
@@ -114,7 +195,27 @@ class Database:
 
                 logging.info(f"{LOG_PREFIX_DATABASE}Default super user created with password hash: {encoded_password[:10]}...")
 
+    def _now(self):
+        """Current epoch, replaced on the instance by tests that drive time explicitly"""
+        return get_current_epoch()
+
+    def close(self):
+        """
+        Close the session and release every connection of the engine.
 
+        Errors are not swallowed, a connection that cannot be released shows up here.
+        With ':memory:' this drops the database, the instance is unusable afterwards.
+        """
+        with self.lock:
+            self.session.close()
+            self.engine.dispose()
+        logging.info(f"{LOG_PREFIX_DATABASE}Database closed")
+
+    def _notify_expiration(self):
+        """Wake up the expiration worker, a reservation got a new expiration deadline"""
+        with self.expiration_condition:
+            self.expiration_pending = True
+            self.expiration_condition.notify_all()
 
     # === Session ===
 
@@ -146,9 +247,9 @@ class Database:
         no_auth = not self.config_dict.get('need_auth', True)
         
         with self.lock:
-            user = self.session.query(User).filter(User.name == name).first()
-            
             if no_auth:
+                user = self.session.query(User).filter(User.name == name).first()
+
                 # NO_AUTH mode: auto-create user if not exists
                 if not user:
                     try:
@@ -162,43 +263,52 @@ class Database:
                         return False, None, "USER_CREATION_ERROR", "Failed to create user"
                 
                 # Set session for no-auth mode
-                session['logged_in_user'] = {
-                    'user_id': user.id,
-                    'user_email': user.email,
-                    'user_name': user.name,
-                    'role': user.role
-                }
-                session.permanent = True
+                self._set_current_user(user)
                 logging.info(f"{LOG_PREFIX_DATABASE}User '{name}' logged in successfully (no-auth mode)")
                 return True, user, None, None
             
             else:
                 # AUTH mode: normal password verification
-                if not user:
+                # The user and the stored password hash are fetched in a single query
+                row = self.session.execute(
+                    select(User, Password.password)
+                    .outerjoin(Password, Password.user_id == User.id)
+                    .where(User.name == name)
+                ).first()
+                if not row:
                     logging.error(f"{LOG_PREFIX_DATABASE}The given user '{name}' to login does not exist")
                     return False, None, "USER_NOT_FOUND", f"User '{name}' does not exist"
 
-                password_entry = self.session.query(Password).filter(Password.user_id == user.id).first()
-                if not password_entry:
+                user, stored_password = row
+                if stored_password is None:
                     logging.error(f"{LOG_PREFIX_DATABASE}It should not happen. There was NO password found for the given name '{name} in the database'")
                     return False, None, "PASSWORD_NOT_FOUND", "Password entry not found"
 
                 # Password is already hashed on client-side, compare directly
-                logging.debug(f"{LOG_PREFIX_DATABASE}Login attempt - stored: {password_entry.password[:10]}..., provided: {password[:10]}...")
-                if password_entry.password != password:
+                logging.debug(f"{LOG_PREFIX_DATABASE}Login attempt - stored: {stored_password[:10]}..., provided: {password[:10]}...")
+                if stored_password != password:
                     logging.error(f"{LOG_PREFIX_DATABASE}The given password for user '{name}' is incorrect")
                     return False, None, "INVALID_PASSWORD", "Invalid credentials"
 
-                session['logged_in_user'] = {
-                    'user_id': user.id,
-                    'user_email': user.email,
-                    'user_name': user.name,
-                    'role': user.role
-                }
-                session.permanent = True
+                self._set_current_user(user)
                 logging.info(f"{LOG_PREFIX_DATABASE}User '{name}' logged in successfully")
                 return True, user, None, None
 
+    def _set_current_user(self, user):
+        """
+        Store user in the Flask session as the logged in user, without checking any credentials.
+
+        Called by login() once the credentials are verified, tests use it directly to act as
+        a user they already hold instead of repeating the whole login.
+        """
+        session['logged_in_user'] = {
+            'user_id': user.id,
+            'user_email': user.email,
+            'user_name': user.name,
+            'role': user.role
+        }
+        session.permanent = True
+
     def logout(self):
         if 'logged_in_user' in session:
             user_name = session['logged_in_user'].get('user_name', 'unknown')
@@ -280,14 +390,12 @@ class Database:
                     user_email = email if email else None
                 else:
                     user_email = email
-                user = User(name=name, email=user_email)
-                self.session.add(user)
-                self.session.flush()
+                # INSERT ... RETURNING hands back the new row as a User, no separate flush
+                user = self.session.scalars(insert(User).values(name=name, email=user_email).returning(User)).one()
 
                 # Create password entry only if password is provided
                 if password:
-                    password_entry = Password(user_id=user.id, password=password)
-                    self.session.add(password_entry)
+                    self.session.execute(insert(Password).values(user_id=user.id, password=password))
                 
                 self.session.commit()
 
@@ -462,8 +570,7 @@ class Database:
 
         with self.lock:
             try:
-                resource = Resource(name=name, comment=comment)
-                self.session.add(resource)
+                resource = self.session.scalars(insert(Resource).values(name=name, comment=comment).returning(Resource)).one()
                 self.session.commit()
                 logging.info(f"{LOG_PREFIX_DATABASE}Resource created: {name}")
                 return True, resource, None, None
@@ -600,54 +707,64 @@ class Database:
                 logging.error(f"{LOG_PREFIX_DATABASE}User {user_id} already has reservation on Resource {resource_id}")
                 return False, None, "DUPLICATE_RESERVATION", "User already has active reservation for this resource"
 
-            # Create new reservation lifecycle record
-            request_epoch = get_current_epoch()
-
-            # Set valid_until_date based on configuration
-            requested_keep_alive = CONFIG.get('requested_keep_alive_sec', 0)
-            if requested_keep_alive and requested_keep_alive > 0:
-                # Option 1: Use requested keep alive for queued reservations
-                valid_until = request_epoch + requested_keep_alive
-            else:
-                # Option 2: No expiration for queued reservations (None = no countdown)
-                valid_until = None
-
-            reservation = ReservationLifecycle(
-                user_id=user_id,
-                resource_id=resource_id,
-                request_date=request_epoch,
-                valid_until_date=valid_until
-            )
-
-            # Check if resource is free
-            last_record = self.session.query(ReservationLifecycle).filter(
-                ReservationLifecycle.resource_id == resource_id,
-                ReservationLifecycle.cancelled_date.is_(None)
-            ).order_by(ReservationLifecycle.request_date.desc()).first()
-
-            is_free = True
-            if last_record:
-                # Resource is free only if last record is released
-                if last_record.released_date is None:
-                    is_free = False
-
-            # If resource is free, auto-approve the reservation
-            if is_free:
-                reservation.approved_date = request_epoch
-                reservation.valid_until_date = request_epoch + CONFIG['approved_keep_alive_sec']
-
-            self.session.add(reservation)
+            request_epoch = self._now()
+            reservation = self._queue_reservation(user_id, resource_id, request_epoch)
             self.session.commit()
+            self._notify_expiration()
 
             # Logging
             request_iso = epoch_to_iso8601(request_epoch)
             user_name = current_user['user_name']
             resource_name = resource.name
-            status = "approved" if is_free else "requested"
+            status = "approved" if reservation.approved_date is not None else "requested"
             logging.info(f"{LOG_PREFIX_DATABASE}Reservation {status}: User {user_id} ({user_name}) for Resource {resource_id} ({resource_name}) at {request_iso}")
 
             return True, reservation, None, None
 
+    def _queue_reservation(self, user_id, resource_id, request_epoch):
+        """
+        Add a new reservation to the session without committing it, the caller holds the lock.
+        Auto-approves it if the resource is free, otherwise it is queued.
+
+        Returns:
+            ReservationLifecycle: The new reservation.
+        """
+        # Set valid_until_date based on configuration
+        requested_keep_alive = CONFIG.get('requested_keep_alive_sec', 0)
+        if requested_keep_alive and requested_keep_alive > 0:
+            # Option 1: Use requested keep alive for queued reservations
+            valid_until = request_epoch + requested_keep_alive
+        else:
+            # Option 2: No expiration for queued reservations (None = no countdown)
+            valid_until = None
+
+        reservation = ReservationLifecycle(
+            user_id=user_id,
+            resource_id=resource_id,
+            request_date=request_epoch,
+            valid_until_date=valid_until
+        )
+
+        # Check if resource is free (autoflush makes reservations added earlier in the same transaction visible)
+        last_record = self.session.query(ReservationLifecycle).filter(
+            ReservationLifecycle.resource_id == resource_id,
+            ReservationLifecycle.cancelled_date.is_(None)
+        ).order_by(ReservationLifecycle.request_date.desc(), ReservationLifecycle.id.desc()).first()
+
+        is_free = True
+        if last_record:
+            # Resource is free only if last record is released
+            if last_record.released_date is None:
+                is_free = False
+
+        # If resource is free, auto-approve the reservation
+        if is_free:
+            reservation.approved_date = request_epoch
+            reservation.valid_until_date = request_epoch + CONFIG['approved_keep_alive_sec']
+
+        self.session.add(reservation)
+        return reservation
+
     def cancel_reservation(self, resource_id, user_id):
         """
         Cancel a queued (not yet approved) reservation for a resource.
@@ -687,7 +804,7 @@ class Database:
                 return False, None, "RESERVATION_NOT_FOUND", "No queued reservation found to cancel"
 
             # Cancel the reservation
-            cancel_epoch = get_current_epoch()
+            cancel_epoch = self._now()
             reservation.cancelled_date = cancel_epoch
             self.session.commit()
 
@@ -739,7 +856,7 @@ class Database:
                 return False, None, "RESERVATION_NOT_FOUND", "No approved reservation found to release"
 
             # Release the reservation
-            release_epoch = get_current_epoch()
+            release_epoch = self._now()
             reservation.released_date = release_epoch
 
             # Find next queued user (not cancelled, not approved yet, requested after current reservation)
@@ -749,7 +866,7 @@ class Database:
                 ReservationLifecycle.cancelled_date.is_(None),
                 ReservationLifecycle.released_date.is_(None),
                 ReservationLifecycle.request_date >= reservation.request_date
-            ).order_by(ReservationLifecycle.request_date.asc()).first()
+            ).order_by(ReservationLifecycle.request_date.asc(), ReservationLifecycle.id.asc()).first()
 
             # Auto-approve next user if exists
             if next_reservation:
@@ -758,6 +875,8 @@ class Database:
                 next_user = self.session.query(User).filter(User.id == next_reservation.user_id).first()
                 logging.info(f"{LOG_PREFIX_DATABASE}Auto-approved next user: {next_reservation.user_id} ({next_user.name}) for Resource {resource_id}")
             self.session.commit()
+            if next_reservation:
+                self._notify_expiration()
 
             # Logging
             release_iso = epoch_to_iso8601(release_epoch)
@@ -784,15 +903,48 @@ class Database:
                 status = "approved" if r.approved_date else "queued"
                 print(f"Reservation {r.id}: {r.user.name} -> {r.resource.name} ({status})")
         """
+        # lambda_stmt caches the compiled SQL keyed by the lambdas' code location,
+        # resource_id is extracted from the closure as a bound parameter on every call
+        stmt = lambda_stmt(lambda: select(ReservationLifecycle).join(User).join(Resource))
+        stmt += lambda s: s.where(
+            ReservationLifecycle.resource_id == resource_id,
+            ReservationLifecycle.cancelled_date.is_(None),
+            ReservationLifecycle.released_date.is_(None)
+        )
+        # Populate .user and .resource from the joined rows instead of a lazy SELECT per reservation
+        stmt += lambda s: s.options(contains_eager(ReservationLifecycle.user), contains_eager(ReservationLifecycle.resource))
+        stmt += lambda s: s.order_by(ReservationLifecycle.request_date.asc(), ReservationLifecycle.id.asc())
+
         with self.lock:
-            reservations = self.session.query(ReservationLifecycle).join(User).join(Resource).filter(
-                ReservationLifecycle.resource_id == resource_id,
-                ReservationLifecycle.cancelled_date.is_(None),
-                ReservationLifecycle.released_date.is_(None)
-            ).order_by(ReservationLifecycle.request_date.asc()).all()
+            reservations = self.session.scalars(stmt).all()
             logging.info(f"{LOG_PREFIX_DATABASE}Retrieved {len(reservations)} active reservations for Resource {resource_id}")
             return reservations
 
+    def count_active_reservations(self, resource_id):
+        """
+        Count the active reservations (not cancelled or released) of a resource.
+
+        Same filter as get_active_reservations(), but a single COUNT(*) without loading any row.
+
+        Args:
+            resource_id (int): ID of the resource to count active reservations for. Required.
+
+        Returns:
+            int: Number of approved and queued reservations of the resource.
+
+        Example:
+            if db.count_active_reservations(1) == 0:
+                print("Resource 1 is free")
+        """
+        stmt = select(func.count()).select_from(ReservationLifecycle).where(
+            ReservationLifecycle.resource_id == resource_id,
+            ReservationLifecycle.cancelled_date.is_(None),
+            ReservationLifecycle.released_date.is_(None)
+        )
+
+        with self.lock:
+            return self.session.scalar(stmt)
+
     def keep_alive_reservation(self, resource_id, user_id, keep_alive_seconds):
         """
         Update valid_until_date for user's approved reservation to extend its validity.
@@ -825,7 +977,7 @@ class Database:
                 return False, None, "RESERVATION_NOT_FOUND", "No active reservation found to keep alive"
 
             # Update valid_until_date based on reservation status
-            current_epoch = get_current_epoch()
+            current_epoch = self._now()
             if reservation.approved_date:
                 # Approved reservation: use approved_keep_alive_sec
                 reservation.valid_until_date = current_epoch + CONFIG['approved_keep_alive_sec']
@@ -849,77 +1001,276 @@ class Database:
 
             return True, reservation, None, None
 
-    def check_expired_reservations(self):
+    def _expirable_conditions(self):
+        """
+        WHERE conditions of the reservations the sweep expires once past their valid_until_date:
+        approved ones always, queued ones only if requested_keep_alive_sec > 0.
+        """
+        conditions = [
+            ReservationLifecycle.cancelled_date.is_(None),
+            ReservationLifecycle.released_date.is_(None),
+            ReservationLifecycle.valid_until_date.isnot(None)
+        ]
+        requested_keep_alive = CONFIG.get('requested_keep_alive_sec', 0)
+        if not (requested_keep_alive and requested_keep_alive > 0):
+            # Queued reservations never expire, an old valid_until_date of theirs is no deadline
+            conditions.append(ReservationLifecycle.approved_date.isnot(None))
+        return conditions
+
+    def seconds_until_next_expiration(self, current_epoch=None):
+        """
+        Seconds until the earliest reservation the sweep would expire reaches its deadline.
+
+        Args:
+            current_epoch (int, optional): Epoch to measure from, read from the clock if not given.
+
+        Returns:
+            int|None: 0 if a reservation is already expired, None if no active reservation has a deadline
+        """
+        with self.lock:
+            next_deadline = self.session.query(func.min(ReservationLifecycle.valid_until_date)).filter(
+                *self._expirable_conditions()
+            ).scalar()
+        if current_epoch is None:
+            current_epoch = self._now()
+
+        if next_deadline is None:
+            return None
+        # A reservation expires once the current epoch is past its valid_until_date
+        return max(0, next_deadline + 1 - current_epoch)
+
+    def wait_for_next_expiration(self, timeout=None):
+        """
+        Block until a sweep expires at least one reservation.
+
+        A sweep that finished before the call counts as well, the signal is consumed
+        by the call, so the next call waits for the next such sweep.
+
+        Args:
+            timeout (float, optional): Seconds to wait at most, None waits forever.
+
+        Returns:
+            bool: True if reservations were expired within timeout, False otherwise.
+        """
+        expired = self.expired_event.wait(timeout)
+        self.expired_event.clear()
+        return expired
+
+    def check_expired_reservations(self, current_epoch=None):
         """
         Check all reservations and handle expired ones.
         - Approved reservations: release them
         - Requested reservations: cancel them (only if requested_keep_alive_sec > 0)
         Called by the application's expiration worker thread.
+
+        Every step is a single statement, so a sweep costs the same number of
+        round-trips no matter how many reservations expired. A sweep with nothing
+        to expire runs one SELECT and opens no write transaction.
+
+        Args:
+            current_epoch (int, optional): Epoch of the sweep, read from the clock if not given.
+                It is bound once and shared by every statement of the sweep.
         """
+        if current_epoch is None:
+            current_epoch = self._now()
+
         with self.lock:
-            current_epoch = get_current_epoch()
+            # Nothing to do, leave the session (and the objects the views loaded) alone
+            anything_expired = self.session.execute(
+                select(ReservationLifecycle.id)
+                .where(*self._expirable_conditions(), ReservationLifecycle.valid_until_date < current_epoch)
+                .limit(1)
+            ).first()
+            if anything_expired is None:
+                return
+
+            current_iso = epoch_to_iso8601(current_epoch)
+            returned_columns = (ReservationLifecycle.id, ReservationLifecycle.user_id, ReservationLifecycle.resource_id)
 
             # Handle expired approved reservations (release them)
-            expired_approved = self.session.query(ReservationLifecycle).filter(
-                ReservationLifecycle.approved_date.isnot(None),
-                ReservationLifecycle.cancelled_date.is_(None),
-                ReservationLifecycle.released_date.is_(None),
-                ReservationLifecycle.valid_until_date < current_epoch
+            expired_approved = self.session.execute(
+                update(ReservationLifecycle)
+                .where(
+                    ReservationLifecycle.approved_date.isnot(None),
+                    ReservationLifecycle.cancelled_date.is_(None),
+                    ReservationLifecycle.released_date.is_(None),
+                    ReservationLifecycle.valid_until_date < current_epoch
+                )
+                .values(released_date=current_epoch)
+                .returning(*returned_columns)
             ).all()
 
-            for reservation in expired_approved:
-                # Release the expired reservation
-                release_epoch = get_current_epoch()
-                reservation.released_date = release_epoch
-
-                # Find next queued user for auto-approval
-                next_reservation = self.session.query(ReservationLifecycle).filter(
-                    ReservationLifecycle.resource_id == reservation.resource_id,
+            # Auto-approve the first queued user of every released resource
+            auto_approved = []
+            if expired_approved:
+                queue = select(
+                    ReservationLifecycle.id,
+                    func.row_number().over(
+                        partition_by=ReservationLifecycle.resource_id,
+                        order_by=(ReservationLifecycle.request_date.asc(), ReservationLifecycle.id.asc())
+                    ).label('position')
+                ).where(
+                    ReservationLifecycle.resource_id.in_({reservation.resource_id for reservation in expired_approved}),
                     ReservationLifecycle.approved_date.is_(None),
                     ReservationLifecycle.cancelled_date.is_(None),
-                    ReservationLifecycle.released_date.is_(None),
-                    ReservationLifecycle.request_date >= reservation.request_date
-                ).order_by(ReservationLifecycle.request_date.asc()).first()
-
-                # Auto-approve next user if exists
-                if next_reservation:
-                    next_reservation.approved_date = release_epoch
-                    next_reservation.valid_until_date = release_epoch + CONFIG['approved_keep_alive_sec']
-                    next_user = self.session.query(User).filter(User.id == next_reservation.user_id).first()
-                    logging.info(f"{LOG_PREFIX_DATABASE}Auto-approved next user: {next_reservation.user_id} ({next_user.name}) for Resource {reservation.resource_id}")
-
-                # Logging
-                release_iso = epoch_to_iso8601(release_epoch)
-                user = self.session.query(User).filter(User.id == reservation.user_id).first()
-                user_name = user.name if user else "Unknown"
-                resource_name = reservation.resource.name
-                logging.info(f"{LOG_PREFIX_DATABASE}Reservation auto-expired: User {reservation.user_id} ({user_name}) for Resource {reservation.resource_id} ({resource_name}) at {release_iso}")
+                    ReservationLifecycle.released_date.is_(None)
+                ).subquery()
+
+                auto_approved = self.session.execute(
+                    update(ReservationLifecycle)
+                    .where(ReservationLifecycle.id.in_(select(queue.c.id).where(queue.c.position == 1)))
+                    .values(approved_date=current_epoch, valid_until_date=current_epoch + CONFIG['approved_keep_alive_sec'])
+                    .returning(*returned_columns)
+                    .execution_options(synchronize_session='fetch')
+                ).all()
 
             # Handle expired requested reservations (cancel them) - only if requested_keep_alive_sec > 0
             requested_keep_alive = CONFIG.get('requested_keep_alive_sec', 0)
             expired_requested = []
             if requested_keep_alive and requested_keep_alive > 0:
-                expired_requested = self.session.query(ReservationLifecycle).filter(
-                    ReservationLifecycle.approved_date.is_(None),
-                    ReservationLifecycle.cancelled_date.is_(None),
-                    ReservationLifecycle.released_date.is_(None),
-                    ReservationLifecycle.valid_until_date.isnot(None),
-                    ReservationLifecycle.valid_until_date < current_epoch
+                expired_requested = self.session.execute(
+                    update(ReservationLifecycle)
+                    .where(
+                        ReservationLifecycle.approved_date.is_(None),
+                        ReservationLifecycle.cancelled_date.is_(None),
+                        ReservationLifecycle.released_date.is_(None),
+                        ReservationLifecycle.valid_until_date.isnot(None),
+                        ReservationLifecycle.valid_until_date < current_epoch
+                    )
+                    .values(cancelled_date=current_epoch)
+                    .returning(*returned_columns)
                 ).all()
 
-                for reservation in expired_requested:
-                    # Cancel the expired requested reservation
-                    cancel_epoch = get_current_epoch()
-                    reservation.cancelled_date = cancel_epoch
+            # The user and resource names of every touched reservation, in one query
+            names = {row.id: row for row in self.session.execute(
+                select(ReservationLifecycle.id, User.name.label('user_name'), Resource.name.label('resource_name'))
+                .select_from(ReservationLifecycle)
+                .join(User)
+                .join(Resource)
+                .where(ReservationLifecycle.id.in_([r.id for r in expired_approved + auto_approved + expired_requested]))
+            )}
 
-                    # Logging
-                    cancel_iso = epoch_to_iso8601(cancel_epoch)
-                    user = self.session.query(User).filter(User.id == reservation.user_id).first()
-                    user_name = user.name if user else "Unknown"
-                    resource_name = reservation.resource.name
-                    logging.info(f"{LOG_PREFIX_DATABASE}Requested reservation auto-expired: User {reservation.user_id} ({user_name}) for Resource {reservation.resource_id} ({resource_name}) at {cancel_iso}")
+            for reservation in expired_approved:
+                logging.info(f"{LOG_PREFIX_DATABASE}Reservation auto-expired: User {reservation.user_id} ({names[reservation.id].user_name}) for Resource {reservation.resource_id} ({names[reservation.id].resource_name}) at {current_iso}")
+            for reservation in auto_approved:
+                logging.info(f"{LOG_PREFIX_DATABASE}Auto-approved next user: {reservation.user_id} ({names[reservation.id].user_name}) for Resource {reservation.resource_id}")
+            for reservation in expired_requested:
+                logging.info(f"{LOG_PREFIX_DATABASE}Requested reservation auto-expired: User {reservation.user_id} ({names[reservation.id].user_name}) for Resource {reservation.resource_id} ({names[reservation.id].resource_name}) at {current_iso}")
 
-            total_expired = len(expired_approved) + (len(expired_requested) if requested_keep_alive and requested_keep_alive > 0 else 0)
+            self.session.commit()
+
+            total_expired = len(expired_approved) + len(expired_requested)
             if total_expired > 0:
+                logging.info(f"{LOG_PREFIX_DATABASE}Processed {total_expired} expired reservations")
+                self.expired_event.set()
+
+            if auto_approved:
+                # The promoted reservations carry new deadlines
+                self._notify_expiration()
+
+    # === Test support ===
+
+    def reset_tables(self):
+        """
+        Delete every row of every table in one transaction and recreate the default users (test_mode only).
+
+        The engine, the schema and the singleton are kept, so test suites can start
+        each test from an empty database without rebuilding it from scratch.
+
+        Returns:
+            tuple: (success, data, error_code, error_message)
+                - data (None): nothing is returned on success either
+        """
+        if not self.config_dict.get('test_mode'):
+            logging.error(f"{LOG_PREFIX_DATABASE}Table reset attempt outside of test mode")
+            return False, None, "UNAUTHORIZED", "Table reset is only available in test mode"
+
+        with self.lock:
+            self.session.rollback()
+            self.session.expunge_all()
+            with self.engine.begin() as connection:
+                # Children first, so that no foreign key points to a deleted row
+                for table in reversed(Base.metadata.sorted_tables):
+                    connection.execute(table.delete())
+
+        self._create_default_admin()
+        logging.info(f"{LOG_PREFIX_DATABASE}All tables have been reset")
+        return True, None, None, None
+
+    def bulk_seed(self, users=(), resources=()):
+        """
+        Insert users and resources in one transaction, bypassing the access checks (test_mode only).
+
+        Args:
+            users (list): dicts with 'name' and optional 'email', 'password' (client-side hash) and 'role'.
+            resources (list): dicts with 'name' and optional 'comment'.
+
+        Returns:
+            tuple: (success, data, error_code, error_message)
+                - data (dict|None): {'users': [User, ...], 'resources': [Resource, ...]} in the given order
+
+        Example:
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': 'john', 'email': 'john@example.com', 'password': hashed_pass}],
+                resources=[{'name': 'Printer'}])
+        """
+        if not self.config_dict.get('test_mode'):
+            logging.error(f"{LOG_PREFIX_DATABASE}Bulk seed attempt outside of test mode")
+            return False, None, "UNAUTHORIZED", "Bulk seed is only available in test mode"
+
+        with self.lock:
+            try:
+                seeded_users = [User(name=user['name'], email=user.get('email'), role=user.get('role', 'user'))
+                                for user in users]
+                seeded_resources = [Resource(name=resource['name'], comment=resource.get('comment'))
+                                    for resource in resources]
+                passwords = [Password(user=seeded_user, password=user['password'])
+                             for seeded_user, user in zip(seeded_users, users) if user.get('password')]
+
+                # One flush and one commit for the whole seed
+                self.session.add_all(seeded_users + seeded_resources + passwords)
                 self.session.commit()
-                logging.info(f"{LOG_PREFIX_DATABASE}Processed {total_expired} expired reservations")
\ No newline at end of file
+
+                logging.info(f"{LOG_PREFIX_DATABASE}Seeded {len(seeded_users)} users and {len(seeded_resources)} resources")
+                return True, {'users': seeded_users, 'resources': seeded_resources}, None, None
+            except Exception as e:
+                self.session.rollback()
+                logging.error(f"{LOG_PREFIX_DATABASE}Error seeding database: {str(e)}")
+                return False, None, "DATABASE_ERROR", "Database error occurred"
+
+    def bulk_request_reservations(self, requests):
+        """
+        Request reservations for several users in one transaction, bypassing the login (test_mode only).
+
+        Every pair goes through the approve-or-queue logic of request_reservation() in the given
+        order, so the first request of a free resource is approved and the following ones are queued.
+        The resource and duplicate checks of request_reservation() are not repeated.
+
+        Args:
+            requests (list): (user_id, resource_id) tuples.
+
+        Returns:
+            tuple: (success, data, error_code, error_message)
+                - data (list|None): ReservationLifecycle objects in the order of requests
+
+        Example:
+            success, reservations, _, _ = db.bulk_request_reservations([(user1.id, 1), (user2.id, 1)])
+        """
+        if not self.config_dict.get('test_mode'):
+            logging.error(f"{LOG_PREFIX_DATABASE}Bulk reservation request attempt outside of test mode")
+            return False, None, "UNAUTHORIZED", "Bulk reservation requests are only available in test mode"
+
+        with self.lock:
+            try:
+                request_epoch = self._now()
+                reservations = [self._queue_reservation(user_id, resource_id, request_epoch)
+                                for user_id, resource_id in requests]
+                self.session.commit()
+                self._notify_expiration()
+
+                logging.info(f"{LOG_PREFIX_DATABASE}Requested {len(reservations)} reservations")
+                return True, reservations, None, None
+            except Exception as e:
+                self.session.rollback()
+                logging.error(f"{LOG_PREFIX_DATABASE}Error requesting reservations: {str(e)}")
+                return False, None, "DATABASE_ERROR", "Database error occurred"
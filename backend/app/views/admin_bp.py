@@ -2,7 +2,6 @@ import logging
 from flask import Blueprint, jsonify, request, current_app
 from .base_view import BaseView
 from ..constants import LOG_PREFIX_ENDPOINT
-from ..database import Database
 
 
 class AdminBlueprintManager:
@@ -41,7 +40,7 @@ class AdminUserAdd(BaseView):
         password = data['password']
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, user, error_code, error_msg = db.create_user(name, email, password)
             if success:
                 return jsonify({"message": "User created successfully", "user_id": user.id}), 201
@@ -80,7 +79,7 @@ class AdminUserModify(BaseView):
             return jsonify({"error": "At least one field must be provided: email, password"}), 400
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, user, error_code, error_msg = db.modify_user(user_id, email, password)
             if success:
                 return jsonify({"message": "User modified successfully", "user_id": user.id}), 200
@@ -117,7 +116,7 @@ class AdminResourceAdd(BaseView):
         comment = data.get('comment')
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, resource, error_code, error_msg = db.create_resource(name, comment)
             if success:
                 return jsonify({"message": "Resource created successfully", "resource_id": resource.id}), 201
@@ -156,7 +155,7 @@ class AdminResourceModify(BaseView):
             return jsonify({"error": "At least one field must be provided: name, comment"}), 400
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, resource, error_code, error_msg = db.modify_resource(resource_id, name, comment)
             if success:
                 return jsonify({"message": "Resource modified successfully", "resource_id": resource.id}), 200
@@ -2,7 +2,6 @@ import logging
 from flask import Blueprint, jsonify, current_app
 from .base_view import BaseView
 from ..constants import LOG_PREFIX_ENDPOINT
-from ..database import Database
 
 class IsAliveView(BaseView):
     def get(self):
@@ -30,7 +29,7 @@ class InfoResourceList(BaseView):
         logging.info(f"{LOG_PREFIX_ENDPOINT}/info/resources endpoint accessed")
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, resources, error_code, error_msg = db.get_resources()
 
             if success:
@@ -72,7 +71,7 @@ class InfoUserList(BaseView):
         logging.info(f"{LOG_PREFIX_ENDPOINT}/info/users endpoint accessed")
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, users, error_code, error_msg = db.get_users()
 
             if success:
@@ -1,8 +1,9 @@
 import logging
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
+from sqlalchemy.orm import contains_eager
 from .base_view import BaseView
 from ..constants import LOG_PREFIX_ENDPOINT
-from ..database import Database, User, ReservationLifecycle, Resource
+from ..database import User, ReservationLifecycle, Resource
 from ..utils import epoch_to_iso8601
 from ...config.config import CONFIG
 
@@ -33,7 +34,7 @@ class RequestReservationView(BaseView):
             if not resource_id:
                 return jsonify({"error": "resource_id is required"}), 400
 
-            db = Database.get_instance()
+            db = current_app.database
             success, reservation, error_code, error_msg = db.request_reservation(resource_id)
 
             if success:
@@ -76,7 +77,7 @@ class CancelReservationView(BaseView):
 
         try:
             # Check authentication at endpoint level
-            db = Database.get_instance()
+            db = current_app.database
             current_user = db.get_current_user()
             if not current_user:
                 return jsonify({"error": "Authentication required"}), 401
@@ -130,7 +131,7 @@ class ReleaseReservationView(BaseView):
 
         try:
             # Check authentication at endpoint level
-            db = Database.get_instance()
+            db = current_app.database
             current_user = db.get_current_user()
             if not current_user:
                 return jsonify({"error": "Authentication required"}), 401
@@ -182,7 +183,7 @@ class KeepAliveReservationView(BaseView):
 
         try:
             # Check authentication at endpoint level
-            db = Database.get_instance()
+            db = current_app.database
             current_user = db.get_current_user()
             if not current_user:
                 return jsonify({"error": "Authentication required"}), 401
@@ -232,15 +233,17 @@ class GetAllUsersActiveReservationsView(BaseView):
         logging.info(f"{LOG_PREFIX_ENDPOINT}/reservation/active/all_users endpoint accessed")
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             current_user = db.get_current_user()
 
             if not current_user:
                 return jsonify({"error": "Authentication required"}), 401
 
-            # Get all active reservations across all resources
+            # Get all active reservations across all resources, .user and .resource come from the joined rows
             with db.lock:
-                reservations = db.session.query(ReservationLifecycle).join(User).join(Resource).filter(
+                reservations = db.session.query(ReservationLifecycle).join(User).join(Resource).options(
+                    contains_eager(ReservationLifecycle.user), contains_eager(ReservationLifecycle.resource)
+                ).filter(
                     ReservationLifecycle.cancelled_date.is_(None),
                     ReservationLifecycle.released_date.is_(None)
                 ).order_by(ReservationLifecycle.request_date.asc()).all()
@@ -287,7 +290,7 @@ class GetUserActiveReservationView(BaseView):
         logging.info(f"{LOG_PREFIX_ENDPOINT}/reservation/active/user endpoint accessed")
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             current_user = db.get_current_user()
 
             if not current_user:
@@ -302,9 +305,11 @@ class GetUserActiveReservationView(BaseView):
             except ValueError:
                 return jsonify({"error": "resource_id must be a valid integer"}), 400
 
-            # Get user's active reservation for the specific resource
+            # Get user's active reservation for the specific resource, with its user and resource in the same query
             with db.lock:
-                reservation = db.session.query(ReservationLifecycle).join(User).join(Resource).filter(
+                reservation = db.session.query(ReservationLifecycle).join(User).join(Resource).options(
+                    contains_eager(ReservationLifecycle.user), contains_eager(ReservationLifecycle.resource)
+                ).filter(
                     ReservationLifecycle.user_id == current_user['user_id'],
                     ReservationLifecycle.resource_id == resource_id,
                     ReservationLifecycle.cancelled_date.is_(None),
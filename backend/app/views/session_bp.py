@@ -2,7 +2,6 @@ import logging
 from flask import Blueprint, jsonify, request, session, current_app
 from .base_view import BaseView
 from ..constants import LOG_PREFIX_ENDPOINT
-from ..database import Database
 
 
 class SessionBlueprintManager:
@@ -41,10 +40,11 @@ class SessionLogin(BaseView):
         # Check if auth is required
         no_auth = not current_app.config['APP_CONFIG'].get('need_auth', True)
         if not no_auth and not password:
-            return jsonify({"error": "Password required when authentication is enabled"}), 400
+            # auth_required lets password-less clients tell this apart from other bad requests
+            return jsonify({"error": "Password required when authentication is enabled", "auth_required": True}), 400
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, user, error_code, error_msg = db.login(name, password)
             if success:
                 return jsonify({"message": "Login successful", "user_name": user.name}), 200
@@ -66,7 +66,7 @@ class SessionLogout(BaseView):
         logging.info(f"{LOG_PREFIX_ENDPOINT}/session/logout endpoint accessed")
 
         try:
-            db = Database.get_instance()
+            db = current_app.database
             success, _, error_code, error_msg = db.logout()
             response = jsonify({"message": "Logout successful" if success else error_msg})
             if success:
@@ -0,0 +1,213 @@
+"""
+Shared pytest fixtures for the backend test suite.
+
+The application and its in-memory Database are built once per test session.
+Each test module runs inside an outer transaction that is rolled back when the
+module finishes, and every test requesting the `db` fixture is additionally
+wrapped in a SAVEPOINT, so the data created by one test never leaks into the next.
+"""
+
+import sys
+import os
+import hashlib
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from flask import session
+from sqlalchemy.orm import Session
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.app.constants import IN_MEMORY_DATABASE
+from backend.app.application import ReserviaApp
+
+# Test configuration constants
+TEST_APP_NAME = 'reservia_test_shared'
+
+TESTUSER_PASSWORD = 'testpass123'
+
+# Arbitrary fixed starting point for the fake clock
+CLOCK_START_EPOCH = 1700000000
+
+TEST_CONFIG = {
+    'app_name': TEST_APP_NAME,
+    'version': '1.0.0',
+    'log': {'log_name': 'test.log', 'level': 'CRITICAL', 'backupCount': 1},
+    'database': {'name': IN_MEMORY_DATABASE},
+    # Enables Database.bulk_seed() for the test data
+    'test_mode': True
+}
+
+# Modules whose tests do not depend on each other, pytest-xdist may spread
+# their tests over every worker: the integration script tests are pure mocks,
+# every reservation and resource test runs in a SAVEPOINT of the worker's own
+# shared database. The tests of any other module stay together on one worker,
+# where they reuse the module scoped fixtures and, for the unittest classes,
+# the class level setup.
+PARALLEL_SAFE_MODULES = {'test_integration_script', 'test_reservation_system', 'test_resource_management'}
+
+def pytest_configure(config):
+    # Registered by pytest-xdist as well, declared here so runs without it do not warn
+    config.addinivalue_line("markers", "xdist_group(name): run the marked tests on the same xdist worker")
+
+def pytest_collection_modifyitems(config, items):
+    """Group the tests by module for `--dist loadgroup`, except the parallel safe modules"""
+    for item in items:
+        module_name = item.module.__name__.rpartition('.')[2]
+        if module_name not in PARALLEL_SAFE_MODULES:
+            item.add_marker(pytest.mark.xdist_group(module_name))
+
+def hash_password(password):
+    """Hash password using SHA-256 (same as client-side)"""
+    return hashlib.sha256(password.encode()).hexdigest()
+
+class PasswordHashes(dict):
+    """Client-side password hashes keyed by plain text password, each computed on first use"""
+
+    def __missing__(self, password):
+        self[password] = hash_password(password)
+        return self[password]
+
+class FakeClock:
+    """Deterministic replacement for Database._now(), advanced explicitly by the tests"""
+
+    def __init__(self, start=CLOCK_START_EPOCH):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, seconds=1):
+        """Advance the clock and return the new epoch"""
+        self.now += seconds
+        return self.now
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """Build the ReserviaApp and its Database once for the whole test session"""
+    # Every run and every pytest-xdist worker gets its own data directory,
+    # pytest keeps the last few and removes the older ones by itself
+    data_dir = tmp_path_factory.mktemp('reservia_test_shared')
+    app = ReserviaApp(dict(TEST_CONFIG, data_dir=str(data_dir)))
+
+    # The expiration worker would share the per-test connection from another thread
+    app.shutdown()
+
+    yield app
+
+    app.database.close()
+
+@pytest.fixture(scope="session", autouse=True)
+def app_context(app):
+    """One request context of the shared app, pushed for the whole test session"""
+    with app.test_request_context() as ctx:
+        yield ctx
+
+@contextmanager
+def bound_session(database, connection):
+    """
+    Temporarily replace the Database session with one bound to connection.
+
+    The session joins the transaction already running on the connection, so
+    commits issued by the Database methods only release a SAVEPOINT, see
+    "Joining a Session into an External Transaction" in the SQLAlchemy docs.
+    """
+    original_session = database.session
+    # The with block closes the test session however the test ends
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as test_session:
+        with database.lock:
+            database.session = test_session
+        try:
+            yield database
+        finally:
+            with database.lock:
+                database.session = original_session
+
+@contextmanager
+def outer_transaction(database):
+    """
+    Connection of the Database engine holding a transaction that is rolled back on exit.
+
+    Sessions handed to bound_session() only release SAVEPOINTs inside it.
+    """
+    connection = database.engine.connect()
+    transaction = connection.begin()
+    # pysqlite defers BEGIN until the first DML statement, start the outer
+    # transaction explicitly so that released SAVEPOINTs stay inside it
+    connection.exec_driver_sql("BEGIN")
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture(scope="session")
+def password_hashes():
+    """Password hashes shared by all tests, the common test passwords are hashed up front"""
+    return PasswordHashes((password, hash_password(password))
+                          for password in ("admin", TESTUSER_PASSWORD, "pass1", "pass2", "pass3", "pass4"))
+
+@pytest.fixture(scope="module")
+def db_connection(app):
+    """Connection holding an outer transaction for one test module, rolled back at module teardown"""
+    with outer_transaction(app.database) as connection:
+        yield connection
+
+@pytest.fixture(scope="module")
+def seeded(app, db_connection, password_hashes):
+    """
+    Test resource and regular user created once per module by the admin.
+
+    Returns:
+        SimpleNamespace: admin, resource and testuser objects (detached, attributes loaded).
+        Nobody is logged in, tests log in as "testuser" / TESTUSER_PASSWORD themselves.
+    """
+    with bound_session(app.database, db_connection) as database:
+        _, admin_user, _, _ = database.login("admin", password_hashes["admin"])
+        _, resource, _, _ = database.create_resource("Test Resource", "A test resource for booking")
+        _, test_user, _, _ = database.create_user("testuser", "test@example.com", password_hashes[TESTUSER_PASSWORD])
+        database.logout()
+
+        for obj in (admin_user, resource, test_user):
+            database.session.refresh(obj)
+        return SimpleNamespace(admin=admin_user, resource=resource, testuser=test_user)
+
+@pytest.fixture
+def db(app, db_connection):
+    """Database whose changes are rolled back to a SAVEPOINT after every test"""
+    database = app.database
+    savepoint = db_connection.begin_nested()
+
+    # The request context is shared, start every test logged out
+    session.clear()
+
+    with bound_session(database, db_connection):
+        yield database
+
+    savepoint.rollback()
+
+@pytest.fixture(scope="session")
+def shared_client(app):
+    """One test client of the shared app, reused by every API test"""
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture
+def client(app, shared_client, db):
+    """
+    The shared test client with an empty session.
+
+    Everything it writes is rolled back with the db SAVEPOINT. Only the session
+    cookie is dropped between tests, the client itself is never rebuilt.
+    """
+    shared_client.delete_cookie(app.config['SESSION_COOKIE_NAME'])
+    return shared_client
+
+@pytest.fixture
+def clock(app, monkeypatch):
+    """Freeze the epoch seen by the Database, tests move it forward with clock.tick()"""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(app.database, "_now", fake_clock)
+    return fake_clock
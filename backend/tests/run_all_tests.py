@@ -17,6 +17,7 @@ Usage:
 import sys
 import os
 import time
+import pytest
 from pathlib import Path
 
 # Color constants
@@ -33,20 +34,11 @@ def run_test_module(module_name, description):
     print(f"{BLUE}{'='*60}{RESET}")
     
     try:
-        # Import and run the test module
-        module = __import__(f'backend.tests.{module_name}', fromlist=[''])
-        
-        # Get all test functions from the module
-        test_functions = [getattr(module, name) for name in dir(module) 
-                         if name.startswith('test_') and callable(getattr(module, name))]
-        
-        if hasattr(module, '__main__') and module_name in sys.modules:
-            # If module has __main__ section, execute it
-            exec(compile(open(f'backend/tests/{module_name}.py').read(), f'{module_name}.py', 'exec'))
-        else:
-            # Otherwise run individual test functions
-            for test_func in test_functions:
-                test_func()
+        # Run the module through pytest so the fixtures in conftest.py are applied
+        module_path = os.path.join(os.path.dirname(__file__), f'{module_name}.py')
+        exit_code = pytest.main([module_path, '-q'])
+        if exit_code != 0:
+            raise AssertionError(f"pytest exit code {int(exit_code)}")
         
         print(f"\n{GREEN}✓ {description} - ALL TESTS PASSED{RESET}")
         return True
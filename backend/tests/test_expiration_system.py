@@ -6,70 +6,88 @@ Tests both database operations and background expiration thread behavior.
 
 import sys
 import os
+import tempfile
+import threading
 import time
-import hashlib
 import unittest
-import shutil
-from pathlib import Path
+from unittest import mock
+from contextlib import ExitStack
 
 # Add project root to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from backend.app.database import Database
+from sqlalchemy import insert, inspect
+
+from backend.app.database import Database, ReservationLifecycle
+from backend.app.constants import IN_MEMORY_DATABASE
 from backend.app.application import ReserviaApp
 
+from conftest import FakeClock, PasswordHashes, bound_session, outer_transaction
+
 class TestExpirationSystem(unittest.TestCase):
     """Test automatic reservation expiration and queue management."""
     
-    def setUp(self):
-        """Set up test environment before each test."""
-        self.cleanup_test_databases()
+    # Client-side password hashes keyed by plain text password, shared by all tests of the class
+    password_hashes = PasswordHashes()
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the application and its database once for all tests of the class."""
+        # Unique per run, so parallel runs never share the log directory
+        cls.data_dir = tempfile.TemporaryDirectory(prefix='reservia_exp_')
         
-        self.config_dict = {
+        cls.config_dict = {
             'app_name': 'reservia_expiration_test',
             'version': '1.0.0',
 
-            'data_dir': os.path.join(str(Path.home()), '.reservia_expiration_test'),
+            'data_dir': cls.data_dir.name,
             'log': {'log_name': 'test.log', 'level': 'INFO', 'backupCount': 1},
-            'database': {'name': 'test_expiration.db'}
+            'database': {'name': IN_MEMORY_DATABASE},
+            'test_mode': True
         }
         
         # Override config for fast testing
         from backend.config.config import CONFIG
-        self.original_keep_alive = CONFIG['approved_keep_alive_sec']
-        self.original_check_interval = CONFIG['expiration_check_interval_sec']
+        cls.original_keep_alive = CONFIG['approved_keep_alive_sec']
         
         CONFIG['approved_keep_alive_sec'] = 3  # 3 seconds expiration
-        CONFIG['expiration_check_interval_sec'] = 1  # Check every 1 second
         
-        self.app = ReserviaApp(self.config_dict)
+        cls.app = ReserviaApp(cls.config_dict)
+        cls.database = cls.app.database
+        
+        # Expiration checks are triggered by the tests with sweep_expired_once()
+        cls.app.shutdown()
     
-    def tearDown(self):
-        """Clean up after each test."""
-        # Restore original config
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the config and drop the test database and its directory."""
         from backend.config.config import CONFIG
-        CONFIG['approved_keep_alive_sec'] = self.original_keep_alive
-        CONFIG['expiration_check_interval_sec'] = self.original_check_interval
+        CONFIG['approved_keep_alive_sec'] = cls.original_keep_alive
         
-        self.cleanup_test_databases()
+        # The app owns its database, closing it drops the in-memory database
+        cls.database.close()
+        cls.data_dir.cleanup()
     
-    def cleanup_test_databases(self):
-        """Clean up test database files and reset singleton."""
-        if Database._instance is not None:
-            try:
-                Database._instance.session.close()
-                Database._instance.engine.dispose()
-            except:
-                pass
-        Database._instance = None
+    def setUp(self):
+        """Run each test in its own transaction on a fake clock."""
+        # Same recipe as the db fixture of conftest.py, everything the test wrote
+        # is rolled back when the stack is closed after the test
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        connection = stack.enter_context(outer_transaction(self.database))
+        stack.enter_context(bound_session(self.database, connection))
+        
+        # The clock only moves when the test ticks it
+        self.clock = FakeClock()
+        stack.enter_context(mock.patch.object(self.database, '_now', self.clock))
         
-        test_path = os.path.join(str(Path.home()), '.reservia_expiration_test')
-        if os.path.exists(test_path):
-            shutil.rmtree(test_path)
+        # Forget the sweeps of the previous tests
+        self.database.expired_event.clear()
     
-    def hash_password(self, password):
-        """Hash password for testing."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def advance(self, seconds):
+        """Move the fake clock forward and run one expiration check."""
+        self.clock.tick(seconds)
+        self.app.sweep_expired_once()
     
     def test_automatic_reservation_expiration(self):
         """Test that approved reservations automatically expire after timeout."""
@@ -77,33 +95,30 @@ class TestExpirationSystem(unittest.TestCase):
             db = Database.get_instance(self.config_dict)
             
             # Setup test data
-            success, _, _, _ = db.login("admin", self.hash_password("admin"))
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': "testuser", 'email': "test@example.com", 'password': self.password_hashes["testpass"]}],
+                resources=[{'name': "Test Resource", 'comment': "Test resource for expiration"}])
             self.assertTrue(success)
-            
-            success, user, _, _ = db.create_user("testuser", "test@example.com", self.hash_password("testpass"))
-            self.assertTrue(success)
-            user_id = user.id
-            
-            success, resource, _, _ = db.create_resource("Test Resource", "Test resource for expiration")
-            self.assertTrue(success)
-            resource_id = resource.id
-            
-            db.logout()
+            resource_id = seeded['resources'][0].id
             
             # User makes reservation
-            success, _, _, _ = db.login("testuser", self.hash_password("testpass"))
+            success, _, _, _ = db.login("testuser", self.password_hashes["testpass"])
             self.assertTrue(success)
             
             success, reservation, _, _ = db.request_reservation(resource_id)
             self.assertTrue(success)
             self.assertIsNotNone(reservation.approved_date)  # Should be auto-approved
             
-            # Wait for expiration
-            time.sleep(4)  # Wait longer than expiration time
+            # The worker would sleep until one second past the 3 seconds keep alive
+            self.assertEqual(db.seconds_until_next_expiration(), 4)
+            
+            # Move past the expiration time
+            self.advance(4)
+            self.assertTrue(db.wait_for_next_expiration(timeout=0), "The sweep should report the expired reservation")
             
             # Check if reservation was auto-expired
-            reservations = db.get_active_reservations(resource_id)
-            self.assertEqual(len(reservations), 0, "Reservation should have been automatically expired")
+            self.assertEqual(db.count_active_reservations(resource_id), 0, "Reservation should have been automatically expired")
+            self.assertIsNone(db.seconds_until_next_expiration(), "No deadline should be left")
     
     def test_queue_auto_approval_after_expiration(self):
         """Test that queued users are automatically approved when current reservation expires."""
@@ -111,25 +126,16 @@ class TestExpirationSystem(unittest.TestCase):
             db = Database.get_instance(self.config_dict)
             
             # Setup test data
-            success, _, _, _ = db.login("admin", self.hash_password("admin"))
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': "testuser1", 'email': "test1@example.com", 'password': self.password_hashes["testpass1"]},
+                       {'name': "testuser2", 'email': "test2@example.com", 'password': self.password_hashes["testpass2"]}],
+                resources=[{'name': "Test Resource", 'comment': "Test resource for queue testing"}])
             self.assertTrue(success)
-            
-            success, user1, _, _ = db.create_user("testuser1", "test1@example.com", self.hash_password("testpass1"))
-            self.assertTrue(success)
-            user1_id = user1.id
-            
-            success, user2, _, _ = db.create_user("testuser2", "test2@example.com", self.hash_password("testpass2"))
-            self.assertTrue(success)
-            user2_id = user2.id
-            
-            success, resource, _, _ = db.create_resource("Test Resource", "Test resource for queue testing")
-            self.assertTrue(success)
-            resource_id = resource.id
-            
-            db.logout()
+            user2_id = seeded['users'][1].id
+            resource_id = seeded['resources'][0].id
             
             # First user makes reservation
-            success, _, _, _ = db.login("testuser1", self.hash_password("testpass1"))
+            success, _, _, _ = db.login("testuser1", self.password_hashes["testpass1"])
             self.assertTrue(success)
             success, reservation1, _, _ = db.request_reservation(resource_id)
             self.assertTrue(success)
@@ -137,14 +143,21 @@ class TestExpirationSystem(unittest.TestCase):
             
             # Second user makes reservation (should be queued)
             db.logout()
-            success, _, _, _ = db.login("testuser2", self.hash_password("testpass2"))
+            success, _, _, _ = db.login("testuser2", self.password_hashes["testpass2"])
             self.assertTrue(success)
             success, reservation2, _, _ = db.request_reservation(resource_id)
             self.assertTrue(success)
             self.assertIsNone(reservation2.approved_date)  # Should be queued
             
-            # Wait for first reservation to expire
-            time.sleep(4)
+            # Move past the expiration time of the first reservation
+            with self.assertLogs(level='INFO') as logs:
+                self.advance(4)
+            
+            # The log lines name the users and the resource, not only their ids
+            output = "\n".join(logs.output)
+            self.assertIn("(testuser1) for Resource", output)
+            self.assertIn("(Test Resource)", output)
+            self.assertIn(f"Auto-approved next user: {user2_id} (testuser2)", output)
             
             # Check that second user was automatically approved
             reservations = db.get_active_reservations(resource_id)
@@ -152,5 +165,108 @@ class TestExpirationSystem(unittest.TestCase):
             self.assertEqual(reservations[0].user_id, user2_id, "Second user should be approved")
             self.assertIsNotNone(reservations[0].approved_date, "Second user should have approved_date set")
 
+    def test_sweep_without_expired_reservations_keeps_session(self):
+        """Test that a sweep with nothing to expire leaves the objects loaded by the session intact."""
+        with self.app.test_request_context():
+            db = Database.get_instance(self.config_dict)
+            
+            success, seeded, _, _ = db.bulk_seed(resources=[{'name': "Test Resource", 'comment': "Loaded by a view"}])
+            self.assertTrue(success)
+            resource = seeded['resources'][0]
+            db.session.refresh(resource)
+            
+            self.advance(1)
+            self.assertFalse(inspect(resource).expired, "A sweep that expired nothing should not roll back the session")
+            self.assertFalse(db.wait_for_next_expiration(timeout=0))
+    
+    def test_worker_signals_expiration(self):
+        """Test that the running expiration worker reports the reservations it expired."""
+        with self.app.test_request_context():
+            db = Database.get_instance(self.config_dict)
+            
+            # Setup test data
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': "testuser3", 'email': "test3@example.com", 'password': self.password_hashes["testpass3"]}],
+                resources=[{'name': "Test Resource", 'comment': "Test resource for the worker"}])
+            self.assertTrue(success)
+            resource_id = seeded['resources'][0].id
+            
+            success, _, _, _ = db.login("testuser3", self.password_hashes["testpass3"])
+            self.assertTrue(success)
+            success, _, _, _ = db.request_reservation(resource_id)
+            self.assertTrue(success)
+            
+            # The worker sweeps as soon as it starts, the reservation is already past its deadline
+            self.clock.tick(4)
+            self.app._start_expiration_thread()
+            try:
+                self.assertTrue(db.wait_for_next_expiration(timeout=5), "The worker should have expired the reservation")
+            finally:
+                self.app.shutdown()
+            
+            self.assertEqual(db.count_active_reservations(resource_id), 0)
+            self.assertFalse(db.wait_for_next_expiration(timeout=0), "The signal should have been consumed")
+
+    def test_overdue_queued_reservation_without_keep_alive(self):
+        """Test that queued reservations set no deadline when requested_keep_alive_sec is 0."""
+        from backend.config.config import CONFIG
+        original_requested_keep_alive = CONFIG['requested_keep_alive_sec']
+        self.addCleanup(CONFIG.__setitem__, 'requested_keep_alive_sec', original_requested_keep_alive)
+        
+        with self.app.test_request_context():
+            db = Database.get_instance(self.config_dict)
+            
+            # Setup test data: a queued reservation left behind with a past valid_until_date
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': "testuser4", 'email': "test4@example.com", 'password': self.password_hashes["testpass4"]}],
+                resources=[{'name': "Test Resource", 'comment': "Test resource for stale queues"}])
+            self.assertTrue(success)
+            resource_id = seeded['resources'][0].id
+            db.session.execute(insert(ReservationLifecycle), [{
+                'user_id': seeded['users'][0].id, 'resource_id': resource_id,
+                'request_date': self.clock() - 20, 'valid_until_date': self.clock() - 10}])
+            db.session.commit()
+            
+            # Queued reservations do not expire, so they do not count as overdue either
+            CONFIG['requested_keep_alive_sec'] = 0
+            self.advance(1)
+            self.assertEqual(db.count_active_reservations(resource_id), 1, "The queued reservation should stay")
+            self.assertIsNone(db.seconds_until_next_expiration(), "A never expiring reservation is no deadline")
+    
+    def test_worker_waits_when_sweep_fails(self):
+        """Test that an overdue deadline the sweep cannot clear does not make the worker spin."""
+        with self.app.test_request_context():
+            db = Database.get_instance(self.config_dict)
+            
+            # Setup test data
+            success, seeded, _, _ = db.bulk_seed(
+                users=[{'name': "testuser5", 'email': "test5@example.com", 'password': self.password_hashes["testpass5"]}],
+                resources=[{'name': "Test Resource", 'comment': "Test resource for failing sweeps"}])
+            self.assertTrue(success)
+            success, _, _, _ = db.bulk_request_reservations([(seeded['users'][0].id, seeded['resources'][0].id)])
+            self.assertTrue(success)
+            
+            # The deadline is overdue and every sweep fails, no new deadline wakes the worker
+            self.clock.tick(4)
+            db.expiration_pending = False
+            self.assertEqual(db.seconds_until_next_expiration(), 0)
+            first_sweep = threading.Event()
+            sweeps = []
+            def failing_sweep(current_epoch=None):
+                sweeps.append(current_epoch)
+                first_sweep.set()
+                raise RuntimeError("sweep failed")
+            
+            with mock.patch.object(db, 'check_expired_reservations', side_effect=failing_sweep):
+                self.app._start_expiration_thread()
+                try:
+                    self.assertTrue(first_sweep.wait(timeout=5), "The worker should have swept")
+                    # Well below the one second minimum wait of the worker
+                    time.sleep(0.3)
+                finally:
+                    self.app.shutdown()
+            
+            self.assertEqual(len(sweeps), 1, "The worker should wait before sweeping again")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
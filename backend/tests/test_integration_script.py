@@ -3,7 +3,7 @@
 Test suite for reservia_integration.py script
 
 Tests the integration script functionality including:
-- Utility functions (get_username, check_no_auth_mode)
+- Utility functions (get_username)
 - Authentication and session management
 - Reservation workflow functions
 - Error handling and edge cases
@@ -12,9 +12,9 @@ Tests the integration script functionality including:
 import unittest
 import sys
 import os
-import subprocess
-from unittest.mock import patch, MagicMock, Mock
-import requests
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import patch, Mock
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -22,7 +22,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 # Import integration script functions
 from integration.reservia_integration import (
     get_username,
-    check_no_auth_mode,
     login,
     reserve_resource,
     check_reservation_status,
@@ -33,127 +32,136 @@ from integration.reservia_integration import (
 )
 
 
+@dataclass(frozen=True)
+class FakeResponse:
+    """
+    Plain stand-in for a requests.Response, the script only reads status_code and json().
+    A body that is an exception is raised by json(), like requests does for a body that is not JSON.
+    """
+    status_code: int = 200
+    body: Any = None
+
+    def json(self):
+        if isinstance(self.body, Exception):
+            raise self.body
+        return self.body
+
+
 class TestIntegrationScript(unittest.TestCase):
     """Test cases for reservia integration script functions"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.base_url = "http://localhost:5000"
-        self.test_username = "testuser"
-        
-    @patch('subprocess.run')
-    def test_get_username_success(self, mock_run):
+    BASE_URL = "http://localhost:5000"
+    TEST_USERNAME = "testuser"
+
+    # Endpoint URLs the script is expected to call, formatted once
+    URL_LOGIN = f"{BASE_URL}/session/login"
+    URL_REQUEST = f"{BASE_URL}/reservation/request"
+    URL_STATUS = f"{BASE_URL}/reservation/active/user?resource_id={RESOURCE_ID}"
+    URL_KEEP_ALIVE = f"{BASE_URL}/reservation/keep_alive"
+    URL_RELEASE = f"{BASE_URL}/reservation/release"
+    URL_CANCEL = f"{BASE_URL}/reservation/cancel"
+
+    @patch('getpass.getuser')
+    def test_get_username_success(self, mock_getuser):
         """Test successful username retrieval"""
-        mock_result = Mock()
-        mock_result.stdout = "testuser\n"
-        mock_run.return_value = mock_result
+        mock_getuser.return_value = "testuser"
         
         username = get_username()
         
         self.assertEqual(username, "testuser")
-        mock_run.assert_called_once_with(['whoami'], capture_output=True, text=True, check=True)
+        mock_getuser.assert_called_once_with()
 
-    @patch('subprocess.run')
+    @patch('getpass.getuser')
     @patch('sys.exit')
-    def test_get_username_failure(self, mock_exit, mock_run):
+    def test_get_username_failure(self, mock_exit, mock_getuser):
         """Test username retrieval failure"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'whoami')
+        mock_getuser.side_effect = OSError("No username set in the environment")
         
         get_username()
         
         mock_exit.assert_called_once_with(1)
 
-    @patch('requests.get')
-    def test_check_no_auth_mode_enabled(self, mock_get):
-        """Test checking no-auth mode when enabled"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "alive", "no_auth": True}
-        mock_get.return_value = mock_response
-        
-        result = check_no_auth_mode(self.base_url)
-        
-        self.assertTrue(result)
-        mock_get.assert_called_once_with(f"{self.base_url}/info/is_alive")
-
-    @patch('requests.get')
-    def test_check_no_auth_mode_disabled(self, mock_get):
-        """Test checking no-auth mode when disabled"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "alive", "no_auth": False}
-        mock_get.return_value = mock_response
-        
-        result = check_no_auth_mode(self.base_url)
-        
-        self.assertFalse(result)
-
-    @patch('requests.get')
-    @patch('sys.exit')
-    def test_check_no_auth_mode_server_error(self, mock_exit, mock_get):
-        """Test checking no-auth mode with server error"""
-        mock_get.side_effect = requests.ConnectionError("Connection failed")
-        
-        check_no_auth_mode(self.base_url)
-        
-        mock_exit.assert_called_once_with(1)
-
     @patch('integration.reservia_integration.get_username')
-    @patch('integration.reservia_integration.check_no_auth_mode')
+    @patch('requests.get')
     @patch('requests.Session')
-    def test_login_no_auth_success(self, mock_session_class, mock_check_no_auth, mock_get_username):
+    def test_login_no_auth_success(self, mock_session_class, mock_get, mock_get_username):
         """Test successful login in no-auth mode"""
         # Setup mocks
-        mock_get_username.return_value = self.test_username
-        mock_check_no_auth.return_value = True
+        mock_get_username.return_value = self.TEST_USERNAME
         
         mock_session = Mock()
         mock_session_class.return_value = mock_session
         
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = FakeResponse()
         mock_session.post.return_value = mock_response
         
         # Test login
-        result = login(self.base_url)
+        result = login(self.BASE_URL)
         
-        # Assertions
+        # Assertions, the login POST is the only request
         self.assertEqual(result, mock_session)
         mock_session.post.assert_called_once_with(
-            f"{self.base_url}/session/login", 
-            json={"name": self.test_username}
+            self.URL_LOGIN, 
+            json={"name": self.TEST_USERNAME}
         )
+        mock_get.assert_not_called()
 
     @patch('integration.reservia_integration.get_username')
-    @patch('integration.reservia_integration.check_no_auth_mode')
     @patch('requests.Session')
-    def test_login_auth_required(self, mock_session_class, mock_check_no_auth, mock_get_username):
+    def test_login_auth_required(self, mock_session_class, mock_get_username):
         """Test login when authentication is required"""
-        mock_get_username.return_value = self.test_username
-        mock_check_no_auth.return_value = False
+        mock_get_username.return_value = self.TEST_USERNAME
         
-        # Mock session to avoid creating actual session object
         mock_session = Mock()
         mock_session_class.return_value = mock_session
         
+        # The server rejects the password-less login
+        mock_session.post.return_value = FakeResponse(400, body={
+            "error": "Password required when authentication is enabled",
+            "auth_required": True
+        })
+        
         # Should raise SystemExit when auth is required
         with self.assertRaises(SystemExit) as cm:
-            login(self.base_url)
+            login(self.BASE_URL)
         
         self.assertEqual(cm.exception.code, 1)
+        mock_session.post.assert_called_once_with(
+            self.URL_LOGIN, 
+            json={"name": self.TEST_USERNAME}
+        )
+
+    @patch('integration.reservia_integration.get_username')
+    @patch('requests.Session')
+    def test_login_failure_without_json_body(self, mock_session_class, mock_get_username):
+        """Test login when the server answers 400 with a body that is not JSON"""
+        mock_get_username.return_value = self.TEST_USERNAME
+        
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        # e.g. an HTML error page of a proxy
+        mock_session.post.return_value = FakeResponse(400, body=ValueError("Expecting value: line 1 column 1 (char 0)"))
+        
+        # Should exit like any other failed login instead of raising the decode error
+        with patch('builtins.print') as mock_print:
+            with self.assertRaises(SystemExit) as cm:
+                login(self.BASE_URL)
+        
+        self.assertEqual(cm.exception.code, 1)
+        mock_print.assert_any_call("❌ Login failed with status code: 400")
 
     def test_reserve_resource_success(self):
         """Test successful resource reservation"""
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = FakeResponse()
         mock_session.post.return_value = mock_response
         
         # Should not raise exception
-        reserve_resource(mock_session, self.base_url)
+        reserve_resource(mock_session, self.BASE_URL)
         
         mock_session.post.assert_called_once_with(
-            f"{self.base_url}/reservation/request",
+            self.URL_REQUEST,
             json={"resource_id": RESOURCE_ID}
         )
 
@@ -161,116 +169,82 @@ class TestIntegrationScript(unittest.TestCase):
     def test_reserve_resource_failure(self, mock_exit):
         """Test resource reservation failure"""
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 409
+        mock_response = FakeResponse(409)
         mock_session.post.return_value = mock_response
         
-        reserve_resource(mock_session, self.base_url)
+        reserve_resource(mock_session, self.BASE_URL)
         
         mock_exit.assert_called_once_with(1)
 
-    def test_check_reservation_status_approved(self):
-        """Test checking reservation status - approved"""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "reservation": {"status": "approved"}
-        }
-        mock_session.get.return_value = mock_response
-        
-        status = check_reservation_status(mock_session, self.base_url)
-        
-        self.assertEqual(status, "approved")
-
-    def test_check_reservation_status_none(self):
-        """Test checking reservation status - no reservation"""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"reservation": None}
-        mock_session.get.return_value = mock_response
-        
-        status = check_reservation_status(mock_session, self.base_url)
-        
-        self.assertIsNone(status)
+    def test_check_reservation_status(self):
+        """Test checking reservation status - approved and no reservation"""
+        cases = [
+            ({"status": "approved"}, "approved"),
+            (None, None),
+        ]
+        for reservation, expected_status in cases:
+            with self.subTest(expected_status=expected_status):
+                mock_session = Mock()
+                mock_session.get.return_value = FakeResponse(body={"reservation": reservation})
+                
+                status = check_reservation_status(mock_session, self.BASE_URL)
+                
+                self.assertEqual(status, expected_status)
+                mock_session.get.assert_called_once_with(self.URL_STATUS)
 
     def test_send_keep_alive_success(self):
         """Test successful keep-alive message"""
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = FakeResponse()
         mock_session.post.return_value = mock_response
         
         # Should not raise exception
-        send_keep_alive(mock_session, self.base_url)
+        send_keep_alive(mock_session, self.BASE_URL)
         
         mock_session.post.assert_called_once_with(
-            f"{self.base_url}/reservation/keep_alive",
+            self.URL_KEEP_ALIVE,
             json={"resource_id": RESOURCE_ID}
         )
 
     def test_send_release_success(self):
         """Test successful resource release"""
         mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = FakeResponse()
         mock_session.post.return_value = mock_response
         
         # Should not raise exception
-        send_release(mock_session, self.base_url)
-        
-        mock_session.post.assert_called_once_with(
-            f"{self.base_url}/reservation/release",
-            json={"resource_id": RESOURCE_ID}
-        )
-
-    @patch('integration.reservia_integration.check_reservation_status')
-    def test_cleanup_reservation_requested(self, mock_check_status):
-        """Test cleanup for requested reservation"""
-        mock_check_status.return_value = "requested"
-        
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_session.post.return_value = mock_response
-        
-        result = cleanup_reservation(mock_session, self.base_url)
-        
-        self.assertTrue(result)
-        mock_session.post.assert_called_once_with(
-            f"{self.base_url}/reservation/cancel",
-            json={"resource_id": RESOURCE_ID}
-        )
-
-    @patch('integration.reservia_integration.check_reservation_status')
-    def test_cleanup_reservation_approved(self, mock_check_status):
-        """Test cleanup for approved reservation"""
-        mock_check_status.return_value = "approved"
+        send_release(mock_session, self.BASE_URL)
         
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_session.post.return_value = mock_response
-        
-        result = cleanup_reservation(mock_session, self.base_url)
-        
-        self.assertTrue(result)
         mock_session.post.assert_called_once_with(
-            f"{self.base_url}/reservation/release",
+            self.URL_RELEASE,
             json={"resource_id": RESOURCE_ID}
         )
 
     @patch('integration.reservia_integration.check_reservation_status')
-    def test_cleanup_reservation_unknown_status(self, mock_check_status):
-        """Test cleanup for unknown reservation status"""
-        mock_check_status.return_value = "unknown"
-        
-        mock_session = Mock()
-        
-        result = cleanup_reservation(mock_session, self.base_url)
-        
-        self.assertFalse(result)
+    def test_cleanup_reservation(self, mock_check_status):
+        """Test cleanup for requested, approved and unknown reservation status"""
+        cases = [
+            ("requested", self.URL_CANCEL, True),
+            ("approved", self.URL_RELEASE, True),
+            ("unknown", None, False),
+        ]
+        for status, expected_url, expected_result in cases:
+            with self.subTest(status=status):
+                mock_check_status.return_value = status
+                
+                mock_session = Mock()
+                mock_session.post.return_value = FakeResponse()
+                
+                result = cleanup_reservation(mock_session, self.BASE_URL)
+                
+                self.assertIs(result, expected_result)
+                if expected_url is None:
+                    mock_session.post.assert_not_called()
+                else:
+                    mock_session.post.assert_called_once_with(
+                        expected_url,
+                        json={"resource_id": RESOURCE_ID}
+                    )
 
 
 if __name__ == '__main__':
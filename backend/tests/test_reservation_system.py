@@ -8,653 +8,488 @@ Comprehensive test suite for reservation system functionality, covering:
 - Complex multi-user reservation workflows
 - Reservation state transitions and validation
 
-All tests use isolated test databases and proper cleanup.
+All tests share the in-memory application of conftest.py, every test runs in a
+SAVEPOINT that is rolled back afterwards. The test steps are logged at DEBUG
+level instead of printed, run pytest with --log-cli-level=DEBUG to follow them.
 """
 
 import sys
 import os
-import json
-import shutil
 import logging
-import time
-import hashlib
-from pathlib import Path
+import pytest
+from contextlib import contextmanager
+from dataclasses import dataclass
+from unittest.mock import ANY
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.app.database import Database, ReservationLifecycle
-from backend.app.application import ReserviaApp
-
-# Color constants
-GREEN = '\033[92m'
-RED = '\033[91m'
-RESET = '\033[0m'
-
-# Test configuration constants
-HOME = str(Path.home())
-TEST_DIR_NAME = '.reservia_test_reservations'
-TEST_APP_NAME = 'reservia_test_reservations'
-TEST_DB_NAME = 'test_reservations.db'
-
-def hash_password(password):
-    """Hash password using SHA-256 (same as client-side)"""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-def cleanup_test_databases():
-    """Clean up test database files and reset singleton"""
-    if Database._instance is not None:
-        try:
-            Database._instance.session.close()
-            Database._instance.engine.dispose()
-        except:
-            pass
-
-    for handler in logging.root.handlers[:]:
-        try:
-            handler.close()
-            logging.root.removeHandler(handler)
-        except:
-            pass
-
-    Database._instance = None
-    time.sleep(0.2)
-
-    test_path = os.path.join(HOME, TEST_DIR_NAME)
-    if os.path.exists(test_path):
-        try:
-            shutil.rmtree(test_path)
-        except OSError:
-            # Force removal if normal removal fails
-            import subprocess
-            subprocess.run(['rm', '-rf', test_path], check=False)
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
 
-# === Database Layer Tests ===
+from backend.app.database import ReservationLifecycle
+from backend.config.config import CONFIG
 
-def test_db_reservation_request_failure():
-    """
-    Test database reservation request failure scenarios including duplicate reservations
-    and proper error handling for already reserved resources.
-    """
-    print("=== Database reservation request failure tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
-
-    app = ReserviaApp(config_dict)
-
-    with app.test_request_context():
-        db = Database.get_instance(config_dict)
-        operation = 0
-
-        operation += 1
-        print(f"\n{operation}. Setup test data")
-        success, admin_user, _, _ = db.login("admin", hash_password("admin"))
-        assert success and admin_user is not None
-        success, test_user, _, _ = db.create_user("testuser", "test@example.com", hash_password("testpass123"))
-        assert success and test_user is not None
-        success, resource, _, _ = db.create_resource("Test Resource", "A test resource for booking")
-        assert success and resource is not None
-        resource_id = resource.id
-        db.logout()
-        success, logged_in_user, _, _ = db.login("testuser", hash_password("testpass123"))
-        assert success and logged_in_user is not None
-        db.session.query(ReservationLifecycle).delete()
-        db.session.commit()
-
-        operation += 1
-        print(f"\n{operation}. First reservation request test")
-        success, first_reservation, _, _ = db.request_reservation(resource_id)
-        assert success and first_reservation is not None
-        assert first_reservation.user_id == test_user.id
-        assert first_reservation.resource_id == resource_id
-        assert first_reservation.request_date is not None
-        assert first_reservation.approved_date is not None
+logger = logging.getLogger(__name__)
 
-        operation += 1
-        print(f"\n{operation}. Duplicate reservation request test")
-        success, second_reservation, error_code, _ = db.request_reservation(resource_id)
-        assert not success and second_reservation is None and error_code == "DUPLICATE_RESERVATION"
+# Reservation state bitmasks (request | approved << 1 | cancelled << 2 | released << 3)
+STATE_REQUESTED = 0b0001
+STATE_APPROVED = 0b0011
+STATE_CANCELLED = 0b0101
+STATE_RELEASED = 0b1011
 
-    print(f"{GREEN}Database reservation request failure tests passed!{RESET}")
+# All reservations ordered by request date, built once so that the statement cache
+# of the engine can hand back the compiled form on every call
+ORDERED_LIFECYCLE_STMT = (
+    select(ReservationLifecycle)
+    .options(selectinload(ReservationLifecycle.user))
+    .order_by(ReservationLifecycle.request_date)
+)
 
-def test_db_reservation_empty_table_operations():
-    """
-    Test reservation operations on empty tables to verify proper error handling
-    when no reservations exist.
-    """
-    print("=== Database reservation empty table operations tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
-
-    app = ReserviaApp(config_dict)
-
-    with app.test_request_context():
-        db = Database.get_instance(config_dict)
-        operation = 0
-
-        operation += 1
-        print(f"\n{operation}. Setup test data")
-        success, admin_user, _, _ = db.login("admin", hash_password("admin"))
-        assert success and admin_user is not None
-        success, test_user, _, _ = db.create_user("testuser", "test@example.com", hash_password("testpass123"))
-        assert success and test_user is not None
-        success, resource, _, _ = db.create_resource("Test Resource", "A test resource for booking")
-        assert success and resource is not None
-        resource_id = resource.id
-        db.logout()
-        success, logged_in_user, _, _ = db.login("testuser", hash_password("testpass123"))
-        assert success and logged_in_user is not None
-        db.session.query(ReservationLifecycle).delete()
-        db.session.commit()
+@pytest.fixture(scope="module")
+def api_users(password_hashes):
+    """Client-side password hashes of the API test users keyed by name, userN logs in with passN"""
+    return {f'user{n}': password_hashes[f'pass{n}'] for n in range(1, 5)}
 
-        operation += 1
-        print(f"\n{operation}. Cancel reservation on empty table test")
-        success, result, error_code, _ = db.cancel_reservation(resource_id, test_user.id)
-        assert not success and result is None and error_code == "RESERVATION_NOT_FOUND"
+def login(client, name, password_hash):
+    """Log the test client in as name"""
+    return client.post('/session/login', json={'name': name, 'password': password_hash})
 
-        operation += 1
-        print(f"\n{operation}. Release reservation on empty table test")
-        success, result, error_code, _ = db.release_reservation(resource_id, test_user.id)
-        assert not success and result is None and error_code == "RESERVATION_NOT_FOUND"
+def seed(db, users=None, resources=()):
+    """
+    Create API test data with one Database.bulk_seed() call instead of admin API requests.
 
-    print(f"{GREEN}Database reservation empty table operations tests passed!{RESET}")
+    Args:
+        db (Database): Database the rows are added to, its config must enable test_mode.
+        users (dict): Client-side password hashes keyed by user name, the email is "<name>@example.com".
+        resources (list): (name, comment) tuples.
 
-def test_db_reservation_lifecycle_workflow():
+    Returns:
+        list: IDs of the created resources in the order of resources.
     """
-    Test complex database reservation workflow with multiple users including
-    requests, cancellations, releases, and auto-approval logic.
+    success, seeded, _, error_msg = db.bulk_seed(
+        users=[{'name': name, 'email': f'{name}@example.com', 'password': password_hash}
+               for name, password_hash in (users or {}).items()],
+        resources=[{'name': name, 'comment': comment} for name, comment in resources])
+    assert success, f"Seeding failed: {error_msg}"
+    return [resource.id for resource in seeded['resources']]
+
+def seed_lifecycle(db, rows):
     """
-    print("=== Database reservation lifecycle workflow tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
+    Insert reservation_lifecycle rows directly with one INSERT and one commit,
+    bypassing the reservation logic when only the resulting state matters.
 
-    app = ReserviaApp(config_dict)
-
-    with app.test_request_context():
-        db = Database.get_instance(config_dict)
-        operation = 0
-
-        # Setup
-        db.session.query(ReservationLifecycle).delete()
-        db.session.commit()
-
-        _, admin_user, _, _ = db.login("admin", hash_password("admin"))
-        _, resource1, _, _ = db.create_resource("Resource1", "Test resource 1")
-        resource1_id = resource1.id
+    Args:
+        db (Database): Database instance the rows are added to.
+        rows (list): Dicts of ReservationLifecycle column values.
+    """
+    db.session.execute(insert(ReservationLifecycle), rows)
+    db.session.commit()
 
-        _, user1, _, _ = db.create_user("user1", "user1@example.com", hash_password("pass1"))
-        _, user2, _, _ = db.create_user("user2", "user2@example.com", hash_password("pass2"))
-        _, user3, _, _ = db.create_user("user3", "user3@example.com", hash_password("pass3"))
-        _, user4, _, _ = db.create_user("user4", "user4@example.com", hash_password("pass4"))
+@contextmanager
+def acting_as(db, user):
+    """
+    Run the enclosed block as user, logged out afterwards.
 
-        operation += 1
-        print(f"\n{operation}. Multiple users request same resource")
-        
-        # User1 requests (should be auto-approved)
+    The user is put into the session directly, the login itself (user lookup and
+    password check) is covered by the session tests and not repeated at every switch.
+    """
+    db._set_current_user(user)
+    try:
+        yield user
+    finally:
         db.logout()
-        _, _, _, _ = db.login("user1", hash_password("pass1"))
-        _, result, _, _ = db.request_reservation(resource1_id)
 
-        # User2 requests (should be queued)
-        db.logout()
-        _, _, _, _ = db.login("user2", hash_password("pass2"))
-        _, result, _, _ = db.request_reservation(resource1_id)
+def lifecycle_rows(db):
+    """Load every reservation (with its user) in one query, indexed by user_id"""
+    return {r.user_id: r for r in db.session.scalars(ORDERED_LIFECYCLE_STMT)}
 
-        # User3 requests (should be queued)
-        db.logout()
-        _, _, _, _ = db.login("user3", hash_password("pass3"))
-        _, result, _, _ = db.request_reservation(resource1_id)
-
-        active_reservations = db.get_active_reservations(resource1_id)
-        print(f"Active reservations after all requests:")
-        for r in active_reservations:
-            status = "approved" if r.approved_date else "requested"
-            print(f"  User: {r.user.name}, Status: {status}")
-            
-            if r.user_id == user1.id:
-                assert r.approved_date is not None  # Should be approved
-            else:
-                assert r.approved_date is None  # Should be queued
-
-        operation += 1
-        print(f"\n{operation}. User1 releases resource, User2 should be auto-approved")
-        
-        db.logout()
-        _, _, _, _ = db.login("user1", hash_password("pass1"))
-        _, _, _, _ = db.release_reservation(resource1_id, user1.id)
-
-        active_reservations = db.get_active_reservations(resource1_id)
-        print(f"Active reservations after User1 release:")
-        for r in active_reservations:
-            status = "approved" if r.approved_date else "requested"
-            print(f"  User: {r.user.name}, Status: {status}")
-            
-            if r.user_id == user2.id:
-                assert r.approved_date is not None  # Should be auto-approved
-            elif r.user_id == user3.id:
-                assert r.approved_date is None  # Should still be queued
-
-        operation += 1
-        print(f"\n{operation}. User3 cancels reservation")
-        
-        db.logout()
-        _, _, _, _ = db.login("user3", hash_password("pass3"))
-        _, _, _, _ = db.cancel_reservation(resource1_id, user3.id)
+def log_rows(title, rows):
+    """Log user and state of the given reservation rows at DEBUG level"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s %s", title, [(r.user.name, f"{reservation_state(r):04b}") for r in rows.values()])
 
-        active_reservations = db.get_active_reservations(resource1_id)
-        print(f"Active reservations after User3 cancel:")
-        for r in active_reservations:
-            status = "approved" if r.approved_date else "requested"
-            print(f"  User: {r.user.name}, Status: {status}")
-            
-            # User3 should not be in active reservations anymore
-            assert r.user_id != user3.id
+def switch_session(client, sessions, name, password_hash):
+    """
+    Make the test client act as name.
 
-    print(f"{GREEN}Database reservation lifecycle workflow tests passed!{RESET}")
+    The Flask session lives entirely in the signed "session" cookie, so the
+    cookie of the first login is cached in sessions and put back on later
+    switches instead of logging out and in again.
+    """
+    cookie = sessions.get(name)
+    if cookie is None:
+        response = login(client, name, password_hash)
+        assert response.status_code == 200, f"Login of {name} failed"
+        sessions[name] = client.get_cookie('session')
+    else:
+        client.set_cookie('session', cookie.value)
+
+def reservation_state(r):
+    """Pack the lifecycle dates of a reservation into a 4-bit state mask"""
+    return ((r.request_date is not None)
+            | (r.approved_date is not None) << 1
+            | (r.cancelled_date is not None) << 2
+            | (r.released_date is not None) << 3)
 
-# === API Endpoint Tests ===
+# === Database Layer Tests ===
 
-def test_api_reservation_request():
+@pytest.mark.parametrize("operation_name, expected_error", [
+    ("cancel", "RESERVATION_NOT_FOUND"),
+    ("release", "RESERVATION_NOT_FOUND"),
+    ("duplicate_request", "DUPLICATE_RESERVATION"),
+])
+def test_db_reservation_empty_table_operations(db, seeded, password_hashes, operation_name, expected_error):
     """
-    Test /reservation/request endpoint functionality including successful requests,
-    queue management, and authorization checks.
+    Test reservation operations without a matching active reservation: cancel and release
+    on an empty table, and a second request for an already reserved resource.
     """
-    print("=== API reservation request endpoint tests started!")
-
-    cleanup_test_databases()
+    resource, testuser = seeded.resource, seeded.testuser
+    success, logged_in_user, _, _ = db.login("testuser", password_hashes["testpass123"])
+    assert success and logged_in_user is not None
+
+    if operation_name == "cancel":
+        success, result, error_code, _ = db.cancel_reservation(resource.id, testuser.id)
+    elif operation_name == "release":
+        success, result, error_code, _ = db.release_reservation(resource.id, testuser.id)
+    else:
+        success, first_reservation, _, _ = db.request_reservation(resource.id)
+        assert success and first_reservation is not None
+        assert first_reservation.user_id == testuser.id
+        assert first_reservation.resource_id == resource.id
+        assert first_reservation.request_date is not None
+        assert first_reservation.approved_date is not None
 
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
+        success, result, error_code, _ = db.request_reservation(resource.id)
 
-    app = ReserviaApp(config_dict)
-    operation = 0
+    assert not success and result is None and error_code == expected_error
 
-    with app.test_client() as client:
-        # Setup
-        client.post('/session/login', data=json.dumps({'name': 'admin', 'password': hash_password('admin')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user1', 'email': 'user1@example.com', 'password': hash_password('pass1')}), content_type='application/json')
-        resp = client.post('/admin/resource/add', data=json.dumps({'name': 'Test Resource', 'comment': 'Test resource'}), content_type='application/json')
-        resource_id = json.loads(resp.data)['resource_id']
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. Unauthorized reservation request test")
-        response = client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 401
-
-        operation += 1
-        print(f"\n{operation}. Successful reservation request test")
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        response = client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 201
-        data = json.loads(response.data)
-        assert data['message'] == 'Reservation request successful'
-        assert data['status'] == 'approved'
-
-        operation += 1
-        print(f"\n{operation}. Duplicate reservation request test")
-        response = client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 409
-        data = json.loads(response.data)
-        assert 'error' in data
-
-    print(f"{GREEN}API reservation request tests passed!{RESET}")
-
-def test_api_reservation_lifecycle():
+def test_db_reservation_lifecycle_workflow(db, seeded, clock, password_hashes):
     """
-    Test complete reservation lifecycle through API endpoints including
-    multiple user requests, queue management, cancellations, and releases.
+    Test complex database reservation workflow with multiple users including
+    requests, cancellations, releases, and auto-approval logic.
     """
-    print("=== API reservation lifecycle tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
-
-    app = ReserviaApp(config_dict)
     operation = 0
 
-    with app.test_client() as client:
-        # Setup: Create users and resources
-        client.post('/session/login', data=json.dumps({'name': 'admin', 'password': hash_password('admin')}), content_type='application/json')
-
-        client.post('/admin/user/add', data=json.dumps({'name': 'user1', 'email': 'user1@example.com', 'password': hash_password('pass1')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user2', 'email': 'user2@example.com', 'password': hash_password('pass2')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user3', 'email': 'user3@example.com', 'password': hash_password('pass3')}), content_type='application/json')
-
-        resp1 = client.post('/admin/resource/add', data=json.dumps({'name': 'resource1', 'comment': 'Test resource 1'}), content_type='application/json')
-        resource1_id = json.loads(resp1.data)['resource_id']
-
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. Multiple reservation requests")
-
-        # User1-3 request resource1
-        for user in ['user1', 'user2', 'user3']:
-            client.post('/session/login', data=json.dumps({'name': user, 'password': hash_password(f'pass{user[-1]}')}), content_type='application/json')
-            client.post('/reservation/request', data=json.dumps({'resource_id': resource1_id}), content_type='application/json')
-            client.post('/session/logout')
-
-        # Check reservations
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        resp = client.get('/reservation/active/all_users')
-        reservations = json.loads(resp.data)['reservations']
-
-        print(f"Reservations after all requests:")
-        for r in reservations:
-            user_name = r['user_name']
-            status = r['status']
-            print(f"  User: {user_name}, Status: {status}")
-            
-            if user_name == 'user1':
-                assert status == 'approved'
-            else:
-                assert status == 'requested'
-
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. User1 releases reservation")
-
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        client.post('/reservation/release', data=json.dumps({'resource_id': resource1_id}), content_type='application/json')
-
-        # Check updated reservations
-        resp = client.get('/reservation/active/all_users')
-        reservations = json.loads(resp.data)['reservations']
-
-        print(f"Reservations after user1 release:")
-        for r in reservations:
-            user_name = r['user_name']
-            status = r['status']
-            print(f"  User: {user_name}, Status: {status}")
-            
-            if user_name == 'user1':
-                assert False, "User1 should not be in active reservations after release"
-            elif user_name == 'user2':
-                assert status == 'approved'  # Should be auto-approved
-            elif user_name == 'user3':
-                assert status == 'requested'
-
-        client.post('/session/logout')
-
-    print(f"{GREEN}API reservation lifecycle tests passed!{RESET}")
-
-
+    # Setup
+    with acting_as(db, seeded.admin):
+        _, resource1, _, _ = db.create_resource("Resource1", "Test resource 1")
+        resource1_id = resource1.id
 
-def test_api_reservation_keep_alive():
+    success, created, _, _ = db.bulk_seed(users=[
+        {'name': name, 'email': f'{name}@example.com', 'password': password_hashes[password]}
+        for name, password in (("user1", "pass1"), ("user2", "pass2"), ("user3", "pass3"))])
+    assert success
+    user1, user2, user3 = created['users']
+
+    operation += 1
+    logger.debug("%d. Multiple users request same resource", operation)
+    
+    # User1 is auto-approved, User2 and User3 are queued behind it, in one transaction
+    success, _, _, _ = db.bulk_request_reservations([(user.id, resource1_id) for user in (user1, user2, user3)])
+    assert success
+
+    active_reservations = db.get_active_reservations(resource1_id)
+    assert [r.user_id for r in active_reservations] == [user1.id, user2.id, user3.id]
+    assert db.count_active_reservations(resource1_id) == 3
+
+    rows = lifecycle_rows(db)
+    log_rows("Reservations after all requests:", rows)
+    assert reservation_state(rows[user1.id]) == STATE_APPROVED  # Should be approved
+    assert reservation_state(rows[user2.id]) == STATE_REQUESTED  # Should be queued
+    assert reservation_state(rows[user3.id]) == STATE_REQUESTED  # Should be queued
+
+    operation += 1
+    logger.debug("%d. User1 releases resource, User2 should be auto-approved", operation)
+    clock.tick()
+    with acting_as(db, user1):
+        db.release_reservation(resource1_id, user1.id)
+
+    rows = lifecycle_rows(db)
+    log_rows("Reservations after User1 release:", rows)
+    assert reservation_state(rows[user1.id]) == STATE_RELEASED
+    assert reservation_state(rows[user2.id]) == STATE_APPROVED  # Should be auto-approved
+    assert reservation_state(rows[user3.id]) == STATE_REQUESTED  # Should still be queued
+
+    operation += 1
+    logger.debug("%d. User3 cancels reservation", operation)
+    clock.tick()
+    with acting_as(db, user3):
+        db.cancel_reservation(resource1_id, user3.id)
+
+    rows = lifecycle_rows(db)
+    log_rows("Reservations after User3 cancel:", rows)
+    assert reservation_state(rows[user3.id]) == STATE_CANCELLED
+
+    # User3 should not be in active reservations anymore
+    by_user = {r.user_id: r for r in db.get_active_reservations(resource1_id)}
+    assert by_user.get(user3.id) is None
+    assert by_user.get(user1.id) is None
+    assert by_user[user2.id].approved_date is not None
+
+def test_db_reservation_release_approves_queue_in_order(db, seeded, clock, password_hashes):
     """
-    Test /reservation/keep_alive endpoint functionality including successful
-    keep alive operations, authorization checks, and error handling.
+    Test that releasing an approved reservation auto-approves the earliest queued
+    request, starting from a queue seeded directly in the lifecycle table.
     """
-    print("=== API reservation keep_alive endpoint tests started!")
+    operation = 0
+    resource_id = seeded.resource.id
+
+    success, created, _, _ = db.bulk_seed(users=[
+        {'name': name, 'email': f'{name}@example.com', 'password': password_hashes[password]}
+        for name, password in (("user1", "pass1"), ("user2", "pass2"), ("user3", "pass3"), ("user4", "pass4"))])
+    assert success
+    user1, user2, user3, user4 = created['users']
+
+    now = clock()
+    seed_lifecycle(db, [
+        {'user_id': user1.id, 'resource_id': resource_id, 'request_date': now,
+         'approved_date': now, 'valid_until_date': now + CONFIG['approved_keep_alive_sec']},
+        {'user_id': user2.id, 'resource_id': resource_id, 'request_date': now + 1},
+        {'user_id': user3.id, 'resource_id': resource_id, 'request_date': now + 2},
+        {'user_id': user4.id, 'resource_id': resource_id, 'request_date': now + 3},
+    ])
+    clock.tick(10)
+
+    operation += 1
+    logger.debug("%d. User1 releases resource, User2 should be auto-approved", operation)
+    with acting_as(db, user1):
+        success, _, _, _ = db.release_reservation(resource_id, user1.id)
+        assert success
+
+    rows = lifecycle_rows(db)
+    log_rows("Reservations after User1 release:", rows)
+    assert reservation_state(rows[user1.id]) == STATE_RELEASED
+    assert reservation_state(rows[user2.id]) == STATE_APPROVED
+    assert rows[user2.id].approved_date == clock()
+    assert reservation_state(rows[user3.id]) == STATE_REQUESTED
+    assert reservation_state(rows[user4.id]) == STATE_REQUESTED
+
+    operation += 1
+    logger.debug("%d. User2 releases resource, User3 should be auto-approved", operation)
+    clock.tick()
+    with acting_as(db, user2):
+        success, _, _, _ = db.release_reservation(resource_id, user2.id)
+        assert success
+
+    rows = lifecycle_rows(db)
+    log_rows("Reservations after User2 release:", rows)
+    assert reservation_state(rows[user2.id]) == STATE_RELEASED
+    assert reservation_state(rows[user3.id]) == STATE_APPROVED
+    assert reservation_state(rows[user4.id]) == STATE_REQUESTED
 
-    cleanup_test_databases()
+# === API Endpoint Tests ===
 
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
+# Fields expected in the JSON body of a scenario step, ANY only requires the key
+APPROVED = {'message': 'Reservation request successful', 'status': 'approved'}
+QUEUED = {'message': 'Reservation request successful', 'status': 'requested'}
+RELEASED = {'message': 'Reservation released successfully'}
+CANCELLED = {'message': 'Reservation cancelled successfully'}
+ERROR = {'error': ANY}
 
-    app = ReserviaApp(config_dict)
-    operation = 0
+@dataclass(frozen=True)
+class ApiScenario:
+    """
+    One reservation flow driven through the API.
 
-    with app.test_client() as client:
-        # Setup
-        client.post('/session/login', data=json.dumps({'name': 'admin', 'password': hash_password('admin')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user1', 'email': 'user1@example.com', 'password': hash_password('pass1')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user2', 'email': 'user2@example.com', 'password': hash_password('pass2')}), content_type='application/json')
-        resp = client.post('/admin/resource/add', data=json.dumps({'name': 'Test Resource', 'comment': 'Test resource'}), content_type='application/json')
-        resource_id = json.loads(resp.data)['resource_id']
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. Unauthorized keep_alive test")
-        # Test: Verify that unauthenticated users cannot access keep_alive endpoint
-        response = client.post('/reservation/keep_alive', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 401  # Should return 401 Unauthorized
-
-        operation += 1
-        print(f"\n{operation}. Keep_alive without reservation test")
-        # Test: Verify that users cannot keep_alive when they have no approved reservation
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        response = client.post('/reservation/keep_alive', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 404  # Should return 404 Not Found
-        data = json.loads(response.data)
-        assert 'error' in data  # Should contain error message
-
-        operation += 1
-        print(f"\n{operation}. Successful keep_alive test")
-        # Test: Verify successful keep_alive operation updates valid_until_date
-        # First make a reservation
-        client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        
-        # Get initial valid_until_date
-        with app.test_request_context():
-            db = Database.get_instance(config_dict)
-            reservations = db.get_active_reservations(resource_id)
-            initial_valid_until = reservations[0].valid_until_date
-        
-        # Wait a moment to ensure time difference
-        time.sleep(1)
-        
-        # Keep alive the reservation
-        response = client.post('/reservation/keep_alive', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 200  # Should return 200 OK
-        data = json.loads(response.data)
-        assert data['message'] == 'Reservation kept alive successfully'  # Should return success message
-        assert 'valid_until_date' in data  # Should include updated valid_until_date
-        
-        # Verify valid_until_date was updated to a later time
-        with app.test_request_context():
-            db = Database.get_instance(config_dict)
-            reservations = db.get_active_reservations(resource_id)
-            new_valid_until = reservations[0].valid_until_date
-            assert new_valid_until > initial_valid_until  # New time should be later than initial
-
-        operation += 1
-        print(f"\n{operation}. Keep_alive queued reservation test")
-        # Test: Verify that users CAN keep_alive queued (non-approved) reservations when requested_keep_alive_sec > 0
-        # User2 makes a request (should be queued since user1 has approved reservation)
-        client.post('/session/logout')
-        client.post('/session/login', data=json.dumps({'name': 'user2', 'password': hash_password('pass2')}), content_type='application/json')
-        client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        
-        # Try to keep alive queued reservation (should succeed since requested_keep_alive_sec = 1800 > 0)
-        response = client.post('/reservation/keep_alive', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        assert response.status_code == 200  # Should return 200 OK
-        data = json.loads(response.data)
-        assert data['message'] == 'Reservation kept alive successfully'  # Should return success message
-        assert 'valid_until_date' in data  # Should include updated valid_until_date
-
-    print(f"{GREEN}API reservation keep_alive tests passed!{RESET}")
-
-def test_api_reservation_active_all_users():
+    steps are (user, action, resource, expected status code, expected body fields)
+    tuples, user None sends the request without a session and action is the
+    /reservation/<action> endpoint. active maps (user, resource) to the status every
+    reservation returned by /reservation/active/all_users must have at the end.
     """
-    Test /reservation/active/all_users endpoint functionality including user authentication
-    and proper retrieval of all active reservations across all resources.
+    name: str
+    resources: tuple
+    steps: tuple
+    active: dict
+
+API_SCENARIOS = [
+    ApiScenario(
+        name="request",
+        resources=('API Resource',),
+        steps=((None, 'request', 'API Resource', 401, ERROR),
+               ('user1', 'request', 'API Resource', 201, APPROVED),
+               ('user1', 'request', 'API Resource', 409, ERROR)),
+        active={('user1', 'API Resource'): 'approved'}),
+    ApiScenario(
+        name="queue",
+        resources=('resource1',),
+        steps=(('user1', 'request', 'resource1', 201, APPROVED),
+               ('user2', 'request', 'resource1', 201, QUEUED),
+               ('user3', 'request', 'resource1', 201, QUEUED)),
+        active={('user1', 'resource1'): 'approved',
+                ('user2', 'resource1'): 'requested',
+                ('user3', 'resource1'): 'requested'}),
+    ApiScenario(
+        name="release_approves_next",
+        resources=('resource1',),
+        steps=(('user1', 'request', 'resource1', 201, APPROVED),
+               ('user2', 'request', 'resource1', 201, QUEUED),
+               ('user3', 'request', 'resource1', 201, QUEUED),
+               ('user1', 'release', 'resource1', 200, RELEASED)),
+        active={('user2', 'resource1'): 'approved',
+                ('user3', 'resource1'): 'requested'}),
+    ApiScenario(
+        name="cancel_leaves_queue",
+        resources=('resource1',),
+        steps=(('user1', 'request', 'resource1', 201, APPROVED),
+               ('user2', 'request', 'resource1', 201, QUEUED),
+               ('user2', 'cancel', 'resource1', 200, CANCELLED),
+               ('user2', 'cancel', 'resource1', 404, ERROR)),
+        active={('user1', 'resource1'): 'approved'}),
+    ApiScenario(
+        name="all_resources",
+        resources=('Resource A', 'Resource B'),
+        steps=(('user1', 'request', 'Resource A', 201, APPROVED),
+               ('user2', 'request', 'Resource B', 201, APPROVED)),
+        active={('user1', 'Resource A'): 'approved',
+                ('user2', 'Resource B'): 'approved'}),
+]
+
+@pytest.mark.parametrize("scenario", API_SCENARIOS, ids=lambda scenario: scenario.name)
+def test_api_reservation(client, db, api_users, scenario):
+    """
+    Test the /reservation/request, /reservation/cancel and /reservation/release
+    endpoints step by step and check the resulting /reservation/active/all_users list.
+    """
+    sessions = {}
+
+    # Setup: the users of the scenario and its resources, ids keyed by name
+    users = {user: api_users[user] for user, _, _, _, _ in scenario.steps if user}
+    resource_ids = dict(zip(scenario.resources,
+                            seed(db, users=users, resources=[(name, 'Test resource') for name in scenario.resources])))
+
+    for step, (user, action, resource, expected_status, expected_fields) in enumerate(scenario.steps, 1):
+        logger.debug("%d. %s %s %s", step, user, action, resource)
+        if user is None:
+            client.delete_cookie('session')
+        else:
+            switch_session(client, sessions, user, users[user])
+        response = client.post(f'/reservation/{action}', json={'resource_id': resource_ids[resource]})
+        data = response.get_json()
+        assert response.status_code == expected_status, f"Step {step}: {data}"
+        # A missing key leaves the dict short, so even ERROR's ANY cannot match it
+        assert {key: data[key] for key in expected_fields if key in data} == expected_fields, f"Step {step}: {data}"
+
+    client.delete_cookie('session')
+    assert client.get('/reservation/active/all_users').status_code == 401
+
+    # Every logged in user sees the reservations of all users
+    name = next(iter(users))
+    switch_session(client, sessions, name, users[name])
+    response = client.get('/reservation/active/all_users')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['message'] == 'All active reservations retrieved successfully'
+    assert data['count'] == len(data['reservations'])
+
+    active = {(r['user_name'], r['resource_name']): r['status'] for r in data['reservations']}
+    logger.debug("Active reservations: %s", active)
+    assert active == scenario.active
+
+def test_api_reservation_keep_alive(client, db, clock, api_users):
+    """
+    Test /reservation/keep_alive endpoint functionality including successful
+    keep alive operations, authorization checks, and error handling.
     """
-    print("=== API reservation active all users endpoint tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
-
-    app = ReserviaApp(config_dict)
     operation = 0
 
-    with app.test_client() as client:
-        # Setup
-        client.post('/session/login', data=json.dumps({'name': 'admin', 'password': hash_password('admin')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user1', 'email': 'user1@example.com', 'password': hash_password('pass1')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user2', 'email': 'user2@example.com', 'password': hash_password('pass2')}), content_type='application/json')
-        resp1 = client.post('/admin/resource/add', data=json.dumps({'name': 'Resource A', 'comment': 'Test resource A'}), content_type='application/json')
-        resp2 = client.post('/admin/resource/add', data=json.dumps({'name': 'Resource B', 'comment': 'Test resource B'}), content_type='application/json')
-        resource_a_id = json.loads(resp1.data)['resource_id']
-        resource_b_id = json.loads(resp2.data)['resource_id']
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. Unauthorized access test")
-        response = client.get('/reservation/active/all_users')
-        assert response.status_code == 401
-
-        operation += 1
-        print(f"\n{operation}. Create reservations across multiple resources")
-        # User1 reserves Resource A
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        client.post('/reservation/request', data=json.dumps({'resource_id': resource_a_id}), content_type='application/json')
-        client.post('/session/logout')
-        
-        # User2 reserves Resource B
-        client.post('/session/login', data=json.dumps({'name': 'user2', 'password': hash_password('pass2')}), content_type='application/json')
-        client.post('/reservation/request', data=json.dumps({'resource_id': resource_b_id}), content_type='application/json')
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. User retrieves all active reservations")
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        response = client.get('/reservation/active/all_users')
-        assert response.status_code == 200
-        
-        data = json.loads(response.data)
-        assert data['message'] == 'All active reservations retrieved successfully'
-        assert 'reservations' in data
-        assert data['count'] == 2
-        
-        # Verify both reservations are present
-        reservations = data['reservations']
-        user_names = [r['user_name'] for r in reservations]
-        resource_names = [r['resource_name'] for r in reservations]
-        
-        assert 'user1' in user_names
-        assert 'user2' in user_names
-        assert 'Resource A' in resource_names
-        assert 'Resource B' in resource_names
-
-    print(f"{GREEN}API reservation active all users tests passed!{RESET}")
-
-def test_api_reservation_active_user():
+    # Setup
+    resource_id, = seed(db, users={name: api_users[name] for name in ('user1', 'user2')},
+                        resources=[('API Resource', 'Test resource')])
+    body = {'resource_id': resource_id}
+
+    operation += 1
+    logger.debug("%d. Unauthorized keep_alive test", operation)
+    # Test: Verify that unauthenticated users cannot access keep_alive endpoint
+    response = client.post('/reservation/keep_alive', json=body)
+    assert response.status_code == 401  # Should return 401 Unauthorized
+
+    operation += 1
+    logger.debug("%d. Keep_alive without reservation test", operation)
+    # Test: Verify that users cannot keep_alive when they have no approved reservation
+    login(client, 'user1', api_users['user1'])
+    response = client.post('/reservation/keep_alive', json=body)
+    assert response.status_code == 404  # Should return 404 Not Found
+    data = response.get_json()
+    assert 'error' in data  # Should contain error message
+
+    operation += 1
+    logger.debug("%d. Successful keep_alive test", operation)
+    # Test: Verify successful keep_alive operation updates valid_until_date
+    # First make a reservation
+    client.post('/reservation/request', json=body)
+    
+    # Get initial valid_until_date
+    initial_valid_until = db.get_active_reservations(resource_id)[0].valid_until_date
+    
+    # Move the frozen clock forward instead of waiting for the wall clock
+    clock.tick()
+    
+    # Keep alive the reservation
+    response = client.post('/reservation/keep_alive', json=body)
+    assert response.status_code == 200  # Should return 200 OK
+    data = response.get_json()
+    assert data['message'] == 'Reservation kept alive successfully'  # Should return success message
+    assert 'valid_until_date' in data  # Should include updated valid_until_date
+    
+    # Verify valid_until_date was updated to a later time
+    new_valid_until = db.get_active_reservations(resource_id)[0].valid_until_date
+    assert new_valid_until > initial_valid_until  # New time should be later than initial
+
+    operation += 1
+    logger.debug("%d. Keep_alive queued reservation test", operation)
+    # Test: Verify that users CAN keep_alive queued (non-approved) reservations when requested_keep_alive_sec > 0
+    # User2 makes a request (should be queued since user1 has approved reservation)
+    client.post('/session/logout')
+    login(client, 'user2', api_users['user2'])
+    client.post('/reservation/request', json=body)
+    
+    # Try to keep alive queued reservation (should succeed since requested_keep_alive_sec = 1800 > 0)
+    response = client.post('/reservation/keep_alive', json=body)
+    assert response.status_code == 200  # Should return 200 OK
+    data = response.get_json()
+    assert data['message'] == 'Reservation kept alive successfully'  # Should return success message
+    assert 'valid_until_date' in data  # Should include updated valid_until_date
+
+def test_api_reservation_active_user(client, db, api_users):
     """
     Test /reservation/active/user endpoint functionality including user authentication
     and proper retrieval of current user's reservation for a specific resource.
     """
-    print("=== API reservation active user endpoint tests started!")
-
-    cleanup_test_databases()
-
-    config_dict = {
-        'app_name': TEST_APP_NAME,
-        'version': '1.0.0',
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME),
-        'log': {'log_name': 'test.log', 'level': 'DEBUG', 'backupCount': 1},
-        'database': {'name': TEST_DB_NAME},
-        'data_dir': os.path.join(HOME, TEST_DIR_NAME)
-    }
-
-    app = ReserviaApp(config_dict)
     operation = 0
 
-    with app.test_client() as client:
-        # Setup
-        client.post('/session/login', data=json.dumps({'name': 'admin', 'password': hash_password('admin')}), content_type='application/json')
-        client.post('/admin/user/add', data=json.dumps({'name': 'user1', 'email': 'user1@example.com', 'password': hash_password('pass1')}), content_type='application/json')
-        resp = client.post('/admin/resource/add', data=json.dumps({'name': 'Test Resource', 'comment': 'Test resource'}), content_type='application/json')
-        resource_id = json.loads(resp.data)['resource_id']
-        client.post('/session/logout')
-
-        operation += 1
-        print(f"\n{operation}. Unauthorized access test")
-        response = client.get(f'/reservation/active/user?resource_id={resource_id}')
-        assert response.status_code == 401
-
-        operation += 1
-        print(f"\n{operation}. No reservation test")
-        client.post('/session/login', data=json.dumps({'name': 'user1', 'password': hash_password('pass1')}), content_type='application/json')
-        response = client.get(f'/reservation/active/user?resource_id={resource_id}')
-        assert response.status_code == 200
-        
-        data = json.loads(response.data)
-        assert data['message'] == 'User active reservation retrieved successfully'
-        assert data['reservation'] is None
-
-        operation += 1
-        print(f"\n{operation}. With reservation test")
-        # Create a reservation
-        client.post('/reservation/request', data=json.dumps({'resource_id': resource_id}), content_type='application/json')
-        
-        response = client.get(f'/reservation/active/user?resource_id={resource_id}')
-        assert response.status_code == 200
-        
-        data = json.loads(response.data)
-        assert data['message'] == 'User active reservation retrieved successfully'
-        assert data['reservation'] is not None
-        assert data['reservation']['user_name'] == 'user1'
-        assert data['reservation']['resource_name'] == 'Test Resource'
-        assert data['reservation']['status'] == 'approved'
-
-    print(f"{GREEN}API reservation active user tests passed!{RESET}")
+    # Setup
+    resource_id, = seed(db, users={'user1': api_users['user1']}, resources=[('API Resource', 'Test resource')])
+    body = {'resource_id': resource_id}
+    active_user_url = f'/reservation/active/user?resource_id={resource_id}'
+
+    operation += 1
+    logger.debug("%d. Unauthorized access test", operation)
+    response = client.get(active_user_url)
+    assert response.status_code == 401
+
+    operation += 1
+    logger.debug("%d. No reservation test", operation)
+    login(client, 'user1', api_users['user1'])
+    response = client.get(active_user_url)
+    assert response.status_code == 200
+    
+    data = response.get_json()
+    assert data['message'] == 'User active reservation retrieved successfully'
+    assert data['reservation'] is None
+
+    operation += 1
+    logger.debug("%d. With reservation test", operation)
+    # Create a reservation
+    client.post('/reservation/request', json=body)
+    
+    response = client.get(active_user_url)
+    assert response.status_code == 200
+    
+    data = response.get_json()
+    assert data['message'] == 'User active reservation retrieved successfully'
+    assert data['reservation'] is not None
+    assert data['reservation']['user_name'] == 'user1'
+    assert data['reservation']['resource_name'] == 'API Resource'
+    assert data['reservation']['status'] == 'approved'
 
 if __name__ == "__main__":
-    try:
-        test_db_reservation_request_failure()
-        test_db_reservation_empty_table_operations()
-        test_db_reservation_lifecycle_workflow()
-        test_api_reservation_request()
-        test_api_reservation_lifecycle()
-        test_api_reservation_keep_alive()
-        test_api_reservation_active_all_users()
-        test_api_reservation_active_user()
-    except Exception as e:
-        print(f"{RED}Tests failed: {e}{RESET}")
-        raise
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-x"]))
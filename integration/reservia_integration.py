@@ -21,6 +21,7 @@ Requirements: requests library, Python 3.6+
 import requests
 import time
 import subprocess
+import getpass
 import os
 import sys
 import hashlib
@@ -32,7 +33,7 @@ import argparse
 
 # Reservia server configuration
 RESOURCE_ID = 1
-# Username will be determined from whoami command
+# Username will be determined from the login name of the current user
 # Password will be removed for no-auth mode
 
 # Default values
@@ -85,38 +86,19 @@ Examples:
 
 def get_username():
     """
-    Get current username from whoami command.
-    
-    Returns:
-        str: Current username
-    """
-    try:
-        result = subprocess.run(['whoami'], capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        print("❌ Failed to get username from whoami")
-        sys.exit(1)
+    Get current username without spawning a whoami process.
 
-def check_no_auth_mode(base_url):
-    """
-    Check if server is running in no-auth mode by checking /info/is_alive endpoint.
+    getpass.getuser() checks the LOGNAME, USER, LNAME and USERNAME environment
+    variables and falls back to the password database.
     
-    Args:
-        base_url (str): Reservia server base URL
-        
     Returns:
-        bool: True if no-auth mode is enabled, False otherwise
+        str: Current username
     """
     try:
-        response = requests.get(f"{base_url}/info/is_alive")
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('no_auth', False)
-    except Exception as e:
-        print(f"❌ Failed to check server status: {e}")
+        return getpass.getuser()
+    except (KeyError, OSError):
+        print("❌ Failed to get username of the current user")
         sys.exit(1)
-    
-    return False
 
 # =============================================================================
 # AUTHENTICATION & SESSION MANAGEMENT
@@ -136,7 +118,7 @@ def login(base_url):
     Exits:
         System exit on authentication failure
     """
-    # Get username from whoami
+    # Get username of the current user
     username = get_username()
     print(f"Logging in as {username}...")
     
@@ -150,27 +132,26 @@ def login(base_url):
     import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
-    # Check if server is in no-auth mode
-    no_auth = check_no_auth_mode(base_url)
-    
-    if no_auth:
-        print("🔓 Server running in no-auth mode")
-        # Prepare login payload without password
-        login_data = {"name": username}
-    else:
-        print("🔒 Server requires authentication")
-        print("❌ This script only supports no-auth mode")
-        print("Please set 'need_auth': False in backend/config/config.py")
-        sys.exit(1)
-    
-    # Attempt login
-    response = session.post(f"{base_url}/session/login", json=login_data)
+    # Log in with the username only, a server requiring authentication rejects it
+    # with auth_required, so no separate no-auth probe is needed
+    response = session.post(f"{base_url}/session/login", json={"name": username})
     
     if response.status_code != 200:
+        try:
+            # A proxy or an older server may answer with a body that is not JSON
+            auth_required = response.status_code == 400 and response.json().get("auth_required")
+        except ValueError:
+            auth_required = False
+        if auth_required:
+            print("🔒 Server requires authentication")
+            print("❌ This script only supports no-auth mode")
+            print("Please set 'need_auth': False in backend/config/config.py")
+            sys.exit(1)
         print(f"❌ Login failed with status code: {response.status_code}")
         print("Check server availability and no-auth mode")
         sys.exit(1)
     
+    print("🔓 Server running in no-auth mode")
     print("✅ Login successful")
     return session
 